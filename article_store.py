@@ -0,0 +1,370 @@
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+from dotenv import load_dotenv
+from text_index import index_text, build_match_query
+from url_dedup import canonical_url, dedup_keys
+
+load_dotenv()
+
+ARTICLE_DB_PATH = os.getenv("ARTICLE_DB_PATH", "articles.db")
+
+# 기사 상태
+STATUS_PENDING = "pending"        # Notion 게시 대기
+STATUS_PUBLISHED = "published"    # Notion 게시 완료
+STATUS_IRRELEVANT = "irrelevant"  # 관련성 부족 / LLM '관련없음'
+STATUS_CLUSTERED = "clustered"    # 같은 사건의 다른 언론사 기사 (대표 기사 페이지에 언론사만 추가)
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+def to_iso_date(pub_date):
+    """네이버 pubDate('Mon, 01 Jan 2026 09:00:00 +0900')를 정렬 가능한 ISO 문자열로 변환"""
+    try:
+        return datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %z").isoformat()
+    except (TypeError, ValueError):
+        return pub_date or ""
+
+# PRAGMA user_version 기반 순차 마이그레이션. 새 스키마 변경은 리스트 끝에 추가.
+MIGRATIONS = [
+    """
+    CREATE TABLE articles (
+        id INTEGER PRIMARY KEY,
+        link TEXT NOT NULL UNIQUE,
+        original_link TEXT,
+        title TEXT NOT NULL,
+        description TEXT,
+        pub_date TEXT,
+        press TEXT,
+        reporter TEXT,
+        content TEXT,
+        category TEXT,
+        summary TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        notion_page_id TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX idx_articles_title ON articles(title);
+    CREATE INDEX idx_articles_status ON articles(status);
+    CREATE INDEX idx_articles_pub_date ON articles(pub_date);
+
+    CREATE VIRTUAL TABLE articles_fts USING fts5(
+        title, content, press, category,
+        content='articles', content_rowid='id'
+    );
+    CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content, press, category)
+        VALUES (new.id, new.title, new.content, new.press, new.category);
+    END;
+    CREATE TRIGGER articles_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content, press, category)
+        VALUES ('delete', old.id, old.title, old.content, old.press, old.category);
+    END;
+    CREATE TRIGGER articles_au AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content, press, category)
+        VALUES ('delete', old.id, old.title, old.content, old.press, old.category);
+        INSERT INTO articles_fts(rowid, title, content, press, category)
+        VALUES (new.id, new.title, new.content, new.press, new.category);
+    END;
+    """,
+    # 한글 부분 검색을 위해 FTS 색인을 bigram 토큰(ko_ngrams) 기반으로 재구성
+    """
+    DROP TRIGGER articles_ai;
+    DROP TRIGGER articles_ad;
+    DROP TRIGGER articles_au;
+    DROP TABLE articles_fts;
+
+    CREATE VIRTUAL TABLE articles_fts USING fts5(title, content, press, category);
+    INSERT INTO articles_fts(rowid, title, content, press, category)
+        SELECT id, ko_ngrams(title), ko_ngrams(content), ko_ngrams(press), ko_ngrams(category) FROM articles;
+
+    CREATE TRIGGER articles_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content, press, category)
+        VALUES (new.id, ko_ngrams(new.title), ko_ngrams(new.content), ko_ngrams(new.press), ko_ngrams(new.category));
+    END;
+    CREATE TRIGGER articles_ad AFTER DELETE ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.id;
+    END;
+    CREATE TRIGGER articles_au AFTER UPDATE OF title, content, press, category ON articles BEGIN
+        DELETE FROM articles_fts WHERE rowid = old.id;
+        INSERT INTO articles_fts(rowid, title, content, press, category)
+        VALUES (new.id, ko_ngrams(new.title), ko_ngrams(new.content), ko_ngrams(new.press), ko_ngrams(new.category));
+    END;
+    """,
+    # 분류에 사용된 모델/프롬프트 버전 (재분류 대상 선정용)
+    """
+    ALTER TABLE articles ADD COLUMN classifier_version TEXT;
+    CREATE INDEX idx_articles_classifier_version ON articles(classifier_version);
+    """,
+    # 같은 사건 기사 묶음. 대표 기사는 cluster_id = id, 나머지는 대표 기사 id.
+    # presses_synced = 0이면 대표 기사 Notion 페이지의 언론사 목록 갱신 필요
+    """
+    ALTER TABLE articles ADD COLUMN cluster_id INTEGER;
+    ALTER TABLE articles ADD COLUMN presses_synced INTEGER NOT NULL DEFAULT 1;
+    UPDATE articles SET cluster_id = id WHERE status IN ('pending', 'published');
+    CREATE INDEX idx_articles_cluster_id ON articles(cluster_id);
+    """,
+    # 정규화 URL (네이버 oid/aid, 추적 파라미터 제거) 기반 중복 확인
+    """
+    ALTER TABLE articles ADD COLUMN canonical_url TEXT;
+    ALTER TABLE articles ADD COLUMN canonical_original_url TEXT;
+    UPDATE articles SET canonical_url = canonical_url(link), canonical_original_url = canonical_url(original_link);
+    CREATE INDEX idx_articles_canonical_url ON articles(canonical_url);
+    CREATE INDEX idx_articles_canonical_original_url ON articles(canonical_original_url);
+    """,
+]
+
+# 키워드 분류기로 분류된 기사의 classifier_version
+KEYWORD_CLASSIFIER_VERSION = "keyword"
+
+# BM25 컬럼 가중치 (title, content, press, category)
+SEARCH_WEIGHTS = (10.0, 1.0, 2.0, 2.0)
+
+class ArticleStore:
+    """
+    수집한 기사의 로컬 저장소 (SQLite + FTS5).
+    메타데이터, 추출 본문, 분류/요약, Notion 게시 상태를 모두 보관하며 Notion은 이 저장소의 동기화 대상.
+    """
+    def __init__(self, path=None):
+        self.path = path or ARTICLE_DB_PATH
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("ko_ngrams", 1, index_text, deterministic=True)
+        self.conn.create_function("canonical_url", 1, canonical_url, deterministic=True)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+    def _migrate(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        for i, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            with self.conn:
+                self.conn.executescript(script)
+                self.conn.execute(f"PRAGMA user_version = {i}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- 중복 확인 ---
+
+    def has_url(self, item):
+        """link/originallink의 정규화 URL 중 하나라도 저장된 기사와 같으면 True"""
+        keys = list(dedup_keys(item))
+        if not keys:
+            return False
+        marks = ", ".join("?" * len(keys))
+        row = self.conn.execute(
+            f"SELECT 1 FROM articles WHERE canonical_url IN ({marks}) OR canonical_original_url IN ({marks}) LIMIT 1",
+            keys + keys
+        ).fetchone()
+        return row is not None
+
+    def find_by_title(self, title):
+        """같은 제목으로 저장된 첫 기사 (id, cluster_id, status) 또는 None. 통신사 기사를 여러 언론사가 그대로 실은 경우 등."""
+        return self.conn.execute(
+            "SELECT id, cluster_id, status FROM articles WHERE title = ? ORDER BY id LIMIT 1", (title,)
+        ).fetchone()
+
+    # --- 저장 / 조회 ---
+
+    def save_article(self, item, details, category=None, summary="", status=STATUS_PENDING, classifier_version=None):
+        """
+        검색 결과(item)와 parse_article_html 결과(details)를 저장하고 article id를 반환.
+        같은 link가 이미 있으면 본문/분류를 갱신. 단, 같은 사건 기사(clustered)로 다시 저장되는 경우에는
+        기존 대표/관련없음 기사의 상태와 분류를 유지.
+        """
+        now = _now()
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO articles (link, original_link, canonical_url, canonical_original_url, title, description,
+                                      pub_date, press, reporter, content, category, summary, status,
+                                      classifier_version, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET
+                    content = excluded.content, press = excluded.press, reporter = excluded.reporter,
+                    category = CASE WHEN (excluded.status = 'clustered' AND articles.status != 'clustered') THEN articles.category ELSE excluded.category END,
+                    summary = CASE WHEN (excluded.status = 'clustered' AND articles.status != 'clustered') THEN articles.summary ELSE excluded.summary END,
+                    classifier_version = CASE WHEN (excluded.status = 'clustered' AND articles.status != 'clustered') THEN articles.classifier_version ELSE excluded.classifier_version END,
+                    status = CASE WHEN articles.status = 'published' OR (excluded.status = 'clustered' AND articles.status != 'clustered') THEN articles.status ELSE excluded.status END,
+                    updated_at = excluded.updated_at
+                """,
+                (item['link'], item.get('originallink'),
+                 canonical_url(item['link']), canonical_url(item.get('originallink')) or None,
+                 item['title'], item.get('description', ''),
+                 to_iso_date(item.get('pubDate')), details.get('company'), details.get('reporter'),
+                 details.get('content', ''), category, summary, status, classifier_version, now, now)
+            )
+        return self.conn.execute("SELECT id FROM articles WHERE link = ?", (item['link'],)).fetchone()[0]
+
+    # --- 사건 묶음 (story cluster) ---
+
+    def start_cluster(self, article_id):
+        with self.conn:
+            self.conn.execute("UPDATE articles SET cluster_id = id WHERE id = ?", (article_id,))
+
+    def add_to_cluster(self, article_id, cluster_id):
+        """기사를 대표 기사(cluster_id)의 묶음에 추가하고 대표 페이지 언론사 갱신을 예약"""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE articles SET cluster_id = ?, status = ?, updated_at = ? WHERE id = ?",
+                (cluster_id, STATUS_CLUSTERED, _now(), article_id)
+            )
+            self.conn.execute("UPDATE articles SET presses_synced = 0 WHERE id = ?", (cluster_id,))
+
+    def cluster_candidates(self, since, until):
+        """pub_date가 [since, until] 범위인 게시 대상 대표 기사 (사건 묶음 비교용)"""
+        return self.conn.execute(
+            """
+            SELECT id, title, description, pub_date FROM articles
+            WHERE cluster_id = id AND status IN (?, ?) AND pub_date BETWEEN ? AND ?
+            """,
+            (STATUS_PENDING, STATUS_PUBLISHED, since, until)
+        ).fetchall()
+
+    def cluster_presses(self, cluster_id):
+        rows = self.conn.execute(
+            "SELECT press FROM articles WHERE cluster_id = ? AND press IS NOT NULL ORDER BY id", (cluster_id,)
+        ).fetchall()
+        presses = []
+        for (press,) in rows:
+            if press not in presses:
+                presses.append(press)
+        return presses
+
+    def unsynced_clusters(self):
+        return self.conn.execute(
+            "SELECT * FROM articles WHERE presses_synced = 0 AND status = ?", (STATUS_PUBLISHED,)
+        ).fetchall()
+
+    def mark_presses_synced(self, cluster_id):
+        with self.conn:
+            self.conn.execute("UPDATE articles SET presses_synced = 1 WHERE id = ?", (cluster_id,))
+
+    def daily_stories(self, day):
+        """
+        해당 날짜(YYYY-MM-DD)의 사건 묶음별 대표 기사와 보도 언론사 목록을 한 번의 쿼리로 조회.
+        보도 건수가 많은 순.
+        """
+        return self.conn.execute(
+            """
+            SELECT c.id, c.title, c.link, c.category, c.summary, c.description,
+                   COUNT(m.id) AS coverage, GROUP_CONCAT(DISTINCT m.press) AS presses
+            FROM articles c JOIN articles m ON m.cluster_id = c.id
+            WHERE c.cluster_id = c.id AND c.status IN (?, ?) AND substr(c.pub_date, 1, 10) = ?
+            GROUP BY c.id
+            ORDER BY coverage DESC, c.pub_date
+            """,
+            (STATUS_PENDING, STATUS_PUBLISHED, day)
+        ).fetchall()
+
+    def get_article(self, article_id):
+        return self.conn.execute("SELECT * FROM articles WHERE id = ?", (article_id,)).fetchone()
+
+    def pending_articles(self):
+        return self.conn.execute(
+            "SELECT * FROM articles WHERE status = ? ORDER BY pub_date", (STATUS_PENDING,)
+        ).fetchall()
+
+    def mark_published(self, article_id, page_id, presses=None):
+        """
+        게시 완료 기록. presses는 게시할 때 보낸 묶음 언론사 목록으로, 그 사이 묶음에 추가된 언론사가 없으면
+        언론사 갱신이 필요 없으므로 presses_synced도 함께 설정.
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE articles SET status = ?, notion_page_id = ?, updated_at = ? WHERE id = ?",
+                (STATUS_PUBLISHED, page_id, _now(), article_id)
+            )
+            if presses is not None and self.cluster_presses(article_id) == presses:
+                self.conn.execute("UPDATE articles SET presses_synced = 1 WHERE id = ?", (article_id,))
+
+    def reset_publication(self):
+        """새 Notion 데이터베이스로 재게시할 수 있도록 게시 상태를 초기화. 초기화된 건수를 반환."""
+        with self.conn:
+            cur = self.conn.execute(
+                "UPDATE articles SET status = ?, notion_page_id = NULL, updated_at = ? WHERE status = ?",
+                (STATUS_PENDING, _now(), STATUS_PUBLISHED)
+            )
+        return cur.rowcount
+
+    def articles_needing_reclassification(self, version, limit=None, include_local=False):
+        """
+        현재 classifier version과 다른 버전으로 분류된 기사 목록.
+        키워드 필터에서 탈락해 분류 자체를 하지 않은 기사(category 없음)는 제외.
+        로컬 분류기 결과(local:*)는 LLM 호출을 줄이려고 남긴 것이므로 include_local일 때만 포함.
+        """
+        sql = """
+            SELECT * FROM articles
+            WHERE category IS NOT NULL AND (classifier_version IS NULL OR classifier_version != ?)
+        """
+        if not include_local:
+            sql += " AND (classifier_version IS NULL OR classifier_version NOT LIKE 'local:%')"
+        sql += " ORDER BY pub_date DESC"
+        params = [version]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    def llm_labelled_articles(self):
+        """LLM이 분류한 기사 (로컬 분류기 학습용). 키워드/로컬 분류기 결과는 제외."""
+        return self.conn.execute(
+            """
+            SELECT * FROM articles
+            WHERE category IS NOT NULL AND classifier_version IS NOT NULL
+              AND classifier_version != ? AND classifier_version NOT LIKE 'local:%'
+            """,
+            (KEYWORD_CLASSIFIER_VERSION,)
+        ).fetchall()
+
+    def update_classification(self, article_id, category, summary, classifier_version, status=None, clear_notion_page=False):
+        """재분류 결과 반영. status는 지정한 경우에만 변경, clear_notion_page=True면 연결된 Notion 페이지 ID 제거."""
+        sql = "UPDATE articles SET category = ?, summary = ?, classifier_version = ?, updated_at = ?"
+        params = [category, summary, classifier_version, _now()]
+        if status is not None:
+            sql += ", status = ?"
+            params.append(status)
+        if clear_notion_page:
+            sql += ", notion_page_id = NULL"
+        sql += " WHERE id = ?"
+        params.append(article_id)
+        with self.conn:
+            self.conn.execute(sql, params)
+
+    # --- 검색 ---
+
+    def search(self, query, category=None, since=None, until=None, limit=20):
+        """
+        제목/본문/언론사/분야 전문 검색 (BM25 순). since/until은 'YYYY-MM-DD' (until 포함).
+        날짜 형식이 잘못되면 ValueError.
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+        sql = f"""
+            SELECT a.*, bm25(articles_fts, {weights}) AS score
+            FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        """
+        params = [match]
+        if category:
+            sql += " AND a.category = ?"
+            params.append(category)
+        if since:
+            sql += " AND a.pub_date >= ?"
+            params.append(date.fromisoformat(since).isoformat())
+        if until:
+            # pub_date는 ISO 문자열이므로 다음 날 0시 미만으로 비교
+            sql += " AND a.pub_date < ?"
+            params.append((date.fromisoformat(until) + timedelta(days=1)).isoformat())
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from scraper import parse_article_html
+
+# HTML_CORPUS_DIR을 설정하고 수집을 한 번 실행하면 코퍼스가 저장됨
+DEFAULT_URL = "https://n.news.naver.com/mnews/article/000/0000000000"
+
+def load_corpus(corpus_dir):
+    """index.tsv(파일명, URL, 인코딩)를 읽어 (url, raw, encoding) 목록 반환. 없으면 *.html 전체 사용."""
+    docs = []
+    index_path = os.path.join(corpus_dir, "index.tsv")
+    if os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) < 2: continue
+                path = os.path.join(corpus_dir, parts[0])
+                if not os.path.exists(path): continue
+                with open(path, "rb") as html_file:
+                    docs.append((parts[1], html_file.read(), (parts[2] if len(parts) > 2 else "") or None))
+    else:
+        for path in sorted(glob.glob(os.path.join(corpus_dir, "*.html"))):
+            with open(path, "rb") as html_file:
+                docs.append((DEFAULT_URL, html_file.read(), None))
+    return docs
+
+def _parse_all(workers, docs):
+    urls, raws, encodings = zip(*docs)
+    started = time.perf_counter()
+    if workers == 1:
+        for doc in docs:
+            parse_article_html(*doc)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(parse_article_html, urls, raws, encodings, chunksize=max(1, len(docs) // (workers * 4))))
+    return time.perf_counter() - started
+
+def worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+def run_benchmark(corpus_dir):
+    docs = load_corpus(corpus_dir)
+    if not docs:
+        print(f"❌ 코퍼스가 비어 있습니다: {corpus_dir} (HTML_CORPUS_DIR을 설정하고 수집을 먼저 실행하세요)")
+        return
+    size_mb = sum(len(raw) for _, raw, _ in docs) / (1024 * 1024)
+    print(f"코퍼스: {len(docs)}건, {size_mb:.1f}MB ({corpus_dir})")
+
+    baseline = None
+    for workers in worker_counts():
+        elapsed = _parse_all(workers, docs)
+        rate = len(docs) / elapsed if elapsed else 0.0
+        baseline = baseline or rate
+        speedup = rate / baseline if baseline else 0.0
+        print(f"- parse workers {workers}: {elapsed:.2f}초, {rate:.1f}건/초, 1 worker 대비 {speedup:.2f}배")
+
+if __name__ == "__main__":
+    corpus_dir = sys.argv[1] if len(sys.argv) > 1 else os.getenv("HTML_CORPUS_DIR", "html_corpus")
+    run_benchmark(corpus_dir)
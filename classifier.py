@@ -1,9 +1,13 @@
 
 from llm_classifier import LLMClassifier
+from local_classifier import LocalClassifier
 
 # Initialize LLM Classifier once
 llm_classifier = LLMClassifier()
 
+# Local first-tier classifier (None until trained with --train-local)
+local_classifier = LocalClassifier.load()
+
 def classify_article_llm(title, content):
     """
     Tries to classify using LLM. Returns (category, type) tuple or None if failed.
@@ -14,28 +18,25 @@ def classify_article_llm(title, content):
             return result.get("category", "기타"), result.get("type", "기타")
     return None, None
 
+# LLMClassifier가 사용하는 분류 체계와 동일한 카테고리별 키워드
+CATEGORY_KEYWORDS = {
+    "정책/지원": ['정책', '지원', '건강보험', '급여', '보험', '법안', '개정', '국회', '정부', '복지부', '보건복지부', '예산', '지자체', '제도', '장애 인정', '조례'],
+    "의학/연구": ['연구', '임상', '치료제', '신약', '논문', '교수', '연구팀', '세포', '이식', '치료법', '학회', '발견'],
+    "사회/환우": ['환우', '캠페인', '기부', '후원', '봉사', '사연', '가족', '인식 개선', '행사', '학교', '편견'],
+    "경제/산업": ['주가', '매출', '출시', '기업', '제약사', '시장', '투자', '상장', '계약', '수출', '실적'],
+    "생활/정보": ['식단', '운동', '관리법', '연속혈당측정기', 'CGM', '인슐린 펌프', '증상', '예방', '생활', '저혈당'],
+}
+
 def classify_category_keyword(text):
     """
-    Fallback: Classifies text into Culture (문화), Sports (체육), Tourism (관광), or Other (기타).
+    Fallback: Classifies text into the same categories LLMClassifier emits
+    (정책/지원, 의학/연구, 사회/환우, 경제/산업, 생활/정보) by keyword counts.
     """
-    text = text.lower()
-    
-    # Tourism keywords
-    tourism_keywords = ['관광', '여행', '투어', '숙박', '호텔', '축제', '유커', '방한', '비자', '면세']
-    if any(k in text for k in tourism_keywords):
-        return "관광"
-        
-    # Sports keywords
-    sports_keywords = ['체육', '스포츠', '경기', '선수', '올림픽', '월드컵', '축구', '야구', '배구', '농구', '팀', '리그']
-    if any(k in text for k in sports_keywords):
-        return "체육"
-        
-    # Culture keywords - broad, so check last
-    culture_keywords = ['문화', '예술', '공연', '전시', '영화', '음악', 'K-POP', '한류', '콘텐츠', '게임', '웹툰', '출판', '도서']
-    if any(k in text for k in culture_keywords):
-        return "문화"
-        
-    return "기타"
+    scores = {category: sum(text.count(k) for k in keywords) for category, keywords in CATEGORY_KEYWORDS.items()}
+    best = max(scores, key=scores.get)
+    if scores[best] == 0:
+        return "사회/환우"
+    return best
 
 def classify_type_keyword(text):
     """
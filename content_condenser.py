@@ -0,0 +1,116 @@
+import os
+import re
+import threading
+from scraper import GENERAL_KEYWORDS, STRONG_KEYWORDS
+
+# 전처리 방식이 바뀌면 올려서 classifier version(재분류 대상)에 반영
+CONDENSER_VERSION = "1"
+
+# LLM에 넘길 본문 토큰 예산
+CONTENT_TOKEN_BUDGET = int(os.getenv("LLM_CONTENT_TOKEN_BUDGET", "400"))
+
+# 기존 방식(content[:1500])과 비교하기 위한 기준 길이
+BASELINE_CHARS = 1500
+
+# 보조 키워드: 분류에 도움이 되는 당뇨 관련 용어 (관련성 키워드보다 낮은 가중치)
+DOMAIN_KEYWORDS = ['당뇨', '인슐린', '혈당', '췌장', '환자', '환우', '연속혈당측정기', 'CGM', '펌프', '치료', '지원', '보험', '급여']
+
+_BOILERPLATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'무단\s*전재', r'재배포\s*금지', r'copyright', r'[ⓒ©]', r'저작권자',
+    r'[\w.+-]+@[\w-]+\.[\w.]+',                 # 이메일 (기자 서명)
+    r'^[가-힣]{2,4}\s*(기자|특파원|통신원)\s*$',   # 기자명만 있는 줄
+    r'^\(?\s*사진\s*[=:]', r'^\[?\s*사진\s*\]?$',  # 사진 캡션
+    r'기사\s*제보', r'제보하기', r'구독하기', r'^관련\s*기사', r'^[▶☞■◆]', r'^\[?광고\]?',
+]]
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_HANGUL_RE = re.compile(r'[가-힣]')
+
+def estimate_tokens(text):
+    """대략적인 토큰 수 추정: 한글은 약 1.5자당 1토큰, 그 외는 약 4자당 1토큰"""
+    hangul = len(_HANGUL_RE.findall(text))
+    return int(hangul / 1.5 + (len(text) - hangul) / 4) + 1
+
+def strip_boilerplate(content):
+    lines = []
+    for line in content.splitlines():
+        line = line.strip()
+        if len(line) < 10:
+            continue
+        if any(p.search(line) for p in _BOILERPLATE_PATTERNS):
+            continue
+        lines.append(line)
+    return lines
+
+def _score(sentence, title_words):
+    score = 0.0
+    for k in STRONG_KEYWORDS:
+        score += 3 * sentence.count(k)
+    for k in GENERAL_KEYWORDS:
+        score += 2 * sentence.count(k)
+    for k in DOMAIN_KEYWORDS:
+        score += sentence.count(k)
+    score += sum(1 for w in title_words if w in sentence)
+    # 긴 문장이 유리하지 않도록 길이로 정규화 (키워드 밀도)
+    return score / (estimate_tokens(sentence) ** 0.5)
+
+def condense_content(title, content, token_budget=None):
+    """
+    본문에서 상투적인 줄(기자 서명, 저작권, 광고 등)을 제거하고
+    키워드 밀도가 높은 문장을 토큰 예산 안에서 골라 원래 순서대로 이어 붙임.
+    첫 문장(리드)은 항상 포함하고, 키워드가 하나도 없는 문장은 제외.
+    """
+    budget = token_budget or CONTENT_TOKEN_BUDGET
+    sentences = []
+    for line in strip_boilerplate(content or ""):
+        sentences.extend(s for s in _SENTENCE_SPLIT_RE.split(line) if s)
+    if not sentences:
+        return ""
+
+    title_words = [w for w in re.findall(r'[0-9A-Za-z가-힣]{2,}', title or "")]
+    scores = {i: _score(sentences[i], title_words) for i in range(1, len(sentences))}
+    ranked = sorted(scores, key=scores.get, reverse=True)
+
+    selected = {0}
+    used = estimate_tokens(sentences[0])
+    for i in ranked:
+        if scores[i] <= 0:
+            break
+        cost = estimate_tokens(sentences[i])
+        if used + cost > budget:
+            continue
+        selected.add(i)
+        used += cost
+
+    text = " ".join(sentences[i] for i in sorted(selected))
+    if used > budget:
+        # 리드 문장 하나가 예산을 넘는 경우
+        text = text[:int(budget * 1.5)]
+    return text
+
+class CondenseStats:
+    """실행 중 절감한 입력 토큰(추정치) 집계"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """실행(--loop의 매 회차)마다 새로 집계"""
+        with self.lock:
+            self.articles = 0
+            self.baseline_tokens = 0
+            self.condensed_tokens = 0
+
+    def record(self, content, condensed):
+        with self.lock:
+            self.articles += 1
+            self.baseline_tokens += estimate_tokens(content[:BASELINE_CHARS])
+            self.condensed_tokens += estimate_tokens(condensed)
+
+    def print_report(self):
+        if not self.articles:
+            return
+        saved = self.baseline_tokens - self.condensed_tokens
+        ratio = saved / self.baseline_tokens if self.baseline_tokens else 0.0
+        print(f"[본문 압축] {self.articles}건, 본문 토큰(추정) {self.baseline_tokens} -> {self.condensed_tokens} "
+              f"({saved} 절감, {ratio:.0%})")
@@ -2,6 +2,7 @@ import os
 import httpx
 from dotenv import load_dotenv
 import json
+from notion_schema import NotionSchema, REQUIRED_PROPERTIES
 
 load_dotenv()
 
@@ -30,14 +31,19 @@ def inspect_database():
             properties = data.get("properties", {})
             for name, prop in properties.items():
                 print(f"- Name: '{name}', Type: '{prop['type']}'")
-                
+            
+            # 실행 시 사용하는 스키마 캐시와 같은 기준으로 확인
+            schema = NotionSchema(NOTION_DATABASE_ID, get_headers)
+            schema.update_from(data)
             print("\n[Required Properties]")
-            print("- '내용' (title)")
-            print("- 'URL' (url)")
-            print("- '날짜' (date)")
-            print("- '분야' (select)")
-            print("- '유형' (select)")
-            print("- '언론사' (multi_select)")
+            for name, kind in REQUIRED_PROPERTIES.items():
+                if kind == "title":
+                    name = schema.title_property
+                options = schema.options.get(name)
+                option_text = f", options: {len(options)}" if options is not None else ""
+                print(f"- '{name}' ({kind}{option_text})")
+            for problem in schema.problems():
+                print(f"⚠️ {problem}")
         else:
             print(f"❌ Failed to access database. Status: {response.status_code}")
             print(f"Response: {response.text}")
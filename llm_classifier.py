@@ -1,36 +1,25 @@
 
 import os
 import json
+import hashlib
 import time
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
+from llm_client import GeminiExecutor, default_timeout_ms
+from content_condenser import condense_content, CondenseStats, CONDENSER_VERSION
 
 load_dotenv()
 
-class LLMClassifier:
-    def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            print("⚠️ GEMINI_API_KEY not found in .env")
-            self.client = None
-        else:
-            self.client = genai.Client(api_key=api_key)
-        self.model_name = 'gemini-2.0-flash' # Using Flash for speed and cost effectiveness
-
-    
-    def classify_article(self, title, content):
-        if not self.client:
-            return None
-
-        prompt = f"""
+# 분류 프롬프트. 수정하면 classifier version이 바뀌어 --reclassify 대상이 됨.
+CLASSIFY_PROMPT = """
 You are an expert news classifier for Type 1 Diabetes (1형 당뇨) news.
 Note: Type 1 Diabetes is officially recognized as a "Pancreatic Disability" (췌장장애) in Korea. Articles discussing "Pancreatic Disability" policy or issues are HIGHLY RELEVANT.
 Analyze the following news article.
 
 [Article]
 Title: {title}
-Content Snippet: {content[:1500]}
+Key Sentences: {content}
 
 [Task 1: Classification]
 Choose ONE category that best fits the article.
@@ -59,63 +48,74 @@ Return ONLY a JSON object. Do not include markdown formatting (```json ... ```).
   "summary": "..."
 }}
 """
+
+def prompt_fingerprint(prompt):
+    return hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+
+class LLMClassifier:
+    def __init__(self):
+        self.model_name = os.getenv("GEMINI_MODEL", 'gemini-2.0-flash') # Using Flash for speed and cost effectiveness
+        # 기본 모델 실패 시 사용할 저렴한 모델 (빈 값이면 비활성화)
+        self.fallback_model_name = os.getenv("GEMINI_FALLBACK_MODEL", 'gemini-2.0-flash-lite')
+        self.executor = None
+        self.condense_stats = CondenseStats()
+
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            print("⚠️ GEMINI_API_KEY not found in .env")
+            self.client = None
+        else:
+            self.client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(timeout=default_timeout_ms())
+            )
+            self.executor = GeminiExecutor(self.client, [self.model_name, self.fallback_model_name])
+
+    @property
+    def max_concurrency(self):
+        return self.executor.max_concurrency if self.executor else 1
+
+    def version_for(self, model_name):
+        # 본문 전처리 방식도 분류 입력이므로 버전에 포함
+        return f"{model_name}:{prompt_fingerprint(CLASSIFY_PROMPT + CONDENSER_VERSION)}"
+
+    @property
+    def version(self):
+        """분류 결과를 만든 모델+프롬프트 식별자 (예: 'gemini-2.0-flash:1a2b3c4d')"""
+        return self.version_for(self.model_name)
+
+    def reset_usage(self):
+        """실행별 리포트를 위해 본문 압축/LLM 사용량 집계 초기화"""
+        self.condense_stats.reset()
+        if self.executor:
+            self.executor.usage.reset()
+
+    def print_usage_report(self):
+        self.condense_stats.print_report()
+        if self.executor:
+            self.executor.usage.print_report()
+    
+    def classify_article(self, title, content):
+        if not self.client:
+            return None
+
+        # 앞 1500자를 그대로 보내는 대신 상투 문구를 제거하고 핵심 문장만 추려 입력 토큰 절감
+        condensed = condense_content(title, content)
+        self.condense_stats.record(content, condensed)
+        prompt = CLASSIFY_PROMPT.format(title=title, content=condensed)
         
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
+            response, model = self.executor.generate(
+                prompt,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json"
                 )
             )
             text = response.text.replace("```json", "").replace("```", "").strip()
-            return json.loads(text)
+            result = json.loads(text)
+            # 하위 모델로 분류된 경우 버전이 달라 이후 --reclassify 대상이 됨
+            result["classifier_version"] = self.version_for(model)
+            return result
         except Exception as e:
             print(f"LLM Classification Error: {e}")
             return None
-
-    def check_similarity(self, new_title, existing_summaries):
-        """
-        Checks if the new article is semantically similar to any of the existing articles.
-        existing_summaries: list of strings (e.g., "Title: ...")
-        Returns: (True, "Similar Title") or (False, None)
-        """
-        if not self.client or not existing_summaries:
-            return False, None
-            
-        # Check only against the last 20 articles to save tokens and time
-        recent_summaries = existing_summaries[-20:]
-        
-        prompt = f"""
-Determine if the [New Article] is effectively covering the **EXACT SAME SPECIFIC EVENT or PRESS RELEASE** as any of the [Existing Articles].
-
-Rules:
-1. Different articles about the same *general topic* (e.g., "Diabetes management tips") are **NOT** duplicates.
-2. Different perspectives or interviews on the same issue are **NOT** duplicates.
-3. Only mark as duplicate if they cover the **same specific event, announcement, or accident** on the same day.
-
-[New Article]
-{new_title}
-
-[Existing Articles]
-{chr(10).join(recent_summaries)}
-
-[Task]
-If the [New Article] is a duplicate of any existing one, return the Title of the existing article.
-If it is new, return "NEW".
-
-Return ONLY the result string.
-"""
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
-            )
-            result = response.text.strip()
-            if result == "NEW":
-                return False, None
-            else:
-                return True, result
-        except Exception as e:
-            print(f"LLM Similarity Check Error: {e}")
-            return False, None
@@ -0,0 +1,156 @@
+import os
+import random
+import threading
+import time
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 재시도 대상 HTTP 상태 코드 (rate limit / 일시적 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+def _env_int(name, default):
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+def _env_float(name, default):
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+def is_retryable(error):
+    code = getattr(error, "code", None)
+    if code in RETRYABLE_STATUS:
+        return True
+    return isinstance(error, (httpx.TransportError, TimeoutError, ConnectionError))
+
+class TokenBucket:
+    """분당 요청 수 제한. acquire()는 토큰이 생길 때까지 대기."""
+    def __init__(self, requests_per_minute, capacity=None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = capacity or max(1, requests_per_minute // 6)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class UsageTracker:
+    """모델별 호출 수, 재시도, 실패, 토큰 사용량, 지연시간 집계"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """실행(--loop의 매 회차)마다 새로 집계"""
+        with self.lock:
+            self.models = {}
+            self.fallbacks = 0
+
+    def _entry(self, model):
+        return self.models.setdefault(model, {
+            "calls": 0, "retries": 0, "failures": 0,
+            "prompt_tokens": 0, "output_tokens": 0, "latency": 0.0,
+        })
+
+    def record_success(self, model, response, latency):
+        usage = getattr(response, "usage_metadata", None)
+        with self.lock:
+            entry = self._entry(model)
+            entry["calls"] += 1
+            entry["latency"] += latency
+            if usage:
+                entry["prompt_tokens"] += usage.prompt_token_count or 0
+                entry["output_tokens"] += usage.candidates_token_count or 0
+
+    def record_retry(self, model):
+        with self.lock:
+            self._entry(model)["retries"] += 1
+
+    def record_failure(self, model):
+        with self.lock:
+            self._entry(model)["failures"] += 1
+
+    def record_fallback(self):
+        with self.lock:
+            self.fallbacks += 1
+
+    def print_report(self):
+        if not self.models:
+            return
+        print("[LLM 사용량 리포트]")
+        for model, e in self.models.items():
+            avg_latency = e["latency"] / e["calls"] if e["calls"] else 0.0
+            print(f"- {model}: 성공 {e['calls']}회, 재시도 {e['retries']}회, 실패 {e['failures']}회, "
+                  f"입력 토큰 {e['prompt_tokens']}, 출력 토큰 {e['output_tokens']}, 평균 응답 {avg_latency:.2f}초")
+        if self.fallbacks:
+            print(f"- 하위 모델 전환: {self.fallbacks}회")
+
+class GeminiExecutor:
+    """
+    Gemini 호출 실행 계층.
+    - 동시 요청 수 제한(세마포어)과 분당 요청 수 제한(token bucket)
+    - 재시도 가능한 오류(429/5xx/타임아웃)는 지수 백오프로 재시도
+    - 기본 모델이 끝내 실패하면 더 저렴한 하위 모델로 전환
+    호출 타임아웃은 클라이언트 생성 시 http_options로 지정.
+    """
+    def __init__(self, client, models, max_concurrency=None, requests_per_minute=None,
+                 max_retries=None, backoff_base=1.0):
+        self.client = client
+        self.models = [m for m in models if m]
+        self.max_concurrency = max_concurrency or _env_int("GEMINI_MAX_CONCURRENCY", 4)
+        self.max_retries = _env_int("GEMINI_MAX_RETRIES", 3) if max_retries is None else max_retries
+        self.backoff_base = backoff_base
+        self.semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self.bucket = TokenBucket(requests_per_minute or _env_int("GEMINI_RPM", 60))
+        self.usage = UsageTracker()
+
+    def _call(self, model, contents, config):
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            started = time.monotonic()
+            try:
+                with self.semaphore:
+                    response = self.client.models.generate_content(model=model, contents=contents, config=config)
+                self.usage.record_success(model, response, time.monotonic() - started)
+                return response
+            except Exception as e:
+                last_error = e
+                if not is_retryable(e) or attempt == self.max_retries:
+                    break
+                self.usage.record_retry(model)
+                # 지수 백오프 + jitter
+                time.sleep(self.backoff_base * (2 ** attempt) + random.uniform(0, self.backoff_base))
+        self.usage.record_failure(model)
+        raise last_error
+
+    def generate(self, contents, config=None):
+        """(response, 응답한 모델명)을 반환. 모든 모델이 실패하면 마지막 예외를 그대로 발생."""
+        last_error = None
+        for i, model in enumerate(self.models):
+            if i > 0:
+                print(f"LLM 하위 모델로 전환: {model} (원인: {last_error})")
+                self.usage.record_fallback()
+            try:
+                return self._call(model, contents, config), model
+            except Exception as e:
+                last_error = e
+        raise last_error
+
+def default_timeout_ms():
+    return int(_env_float("GEMINI_TIMEOUT", 30.0) * 1000)
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import math
+import time
+import hashlib
+from collections import Counter
+from dotenv import load_dotenv
+from content_condenser import condense_content
+
+load_dotenv()
+
+LOCAL_MODEL_PATH = os.getenv("LOCAL_MODEL_PATH", "local_model.json")
+
+# 로컬 분류 결과가 만족해야 하는 목표 정확도(precision). 학습 시 검증 세트에서 이 값을 만족하는
+# 확신도 임계값을 골라 모델에 저장하고, 그 이상일 때만 로컬 결과를 사용 (나머지는 Gemini로 넘김)
+LOCAL_CLASSIFIER_PRECISION = float(os.getenv("LOCAL_CLASSIFIER_PRECISION", "0.95"))
+
+# 임계값 이상 검증 기사가 이보다 적으면 정확도를 믿을 수 없으므로 임계값을 정하지 않음
+MIN_CALIBRATION_SAMPLES = 10
+
+LOCAL_VERSION_PREFIX = "local:"
+
+_NON_WORD_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+def extract_features(title, content):
+    """
+    문자 2~3-gram 특징. 제목 n-gram은 'T' 접두어로 본문과 구분해 가중치를 따로 학습.
+    본문은 LLM 입력과 같은 압축 본문을 사용.
+    """
+    features = Counter()
+    for prefix, text in (("T", title or ""), ("B", condense_content(title, content or ""))):
+        text = _NON_WORD_RE.sub(" ", text.lower())
+        for word in text.split():
+            padded = f" {word} "
+            for n in (2, 3):
+                for i in range(len(padded) - n + 1):
+                    features[prefix + padded[i:i+n]] += 1
+    return features
+
+class LocalClassifier:
+    """
+    문자 n-gram 다항 나이브 베이즈 분류기. LLM이 이미 분류한 기사로 학습하며
+    확신도가 높은 기사만 직접 분류하고 나머지는 Gemini로 넘기는 1차 분류기로 사용.
+    """
+    def __init__(self, model):
+        self.classes = model["classes"]
+        self.class_log_prior = model["class_log_prior"]
+        self.feature_log_prob = model["feature_log_prob"]
+        self.unseen_log_prob = model["unseen_log_prob"]
+        self.vocab = set(model["vocab"])
+        # 검증 세트에서 고른 확신도 임계값. None이면 로컬 결과를 사용하지 않음
+        self.threshold = model.get("threshold")
+        self.version = LOCAL_VERSION_PREFIX + model["fingerprint"]
+        self.model = model
+
+    @classmethod
+    def train(cls, samples, min_df=2, alpha=1.0):
+        """samples: (title, content, category) 목록"""
+        docs = [(extract_features(t, c), label) for t, c, label in samples]
+
+        df = Counter()
+        for features, _ in docs:
+            df.update(features.keys())
+        vocab = {f for f, count in df.items() if count >= min_df}
+
+        class_docs = Counter(label for _, label in docs)
+        class_features = {label: Counter() for label in class_docs}
+        for features, label in docs:
+            class_features[label].update({f: n for f, n in features.items() if f in vocab})
+
+        classes = sorted(class_docs)
+        total_docs = len(docs)
+        feature_log_prob = {}
+        unseen_log_prob = {}
+        for label in classes:
+            total = sum(class_features[label].values()) + alpha * len(vocab)
+            feature_log_prob[label] = {f: math.log((n + alpha) / total) for f, n in class_features[label].items()}
+            unseen_log_prob[label] = math.log(alpha / total)
+
+        model = {
+            "classes": classes,
+            "class_log_prior": {label: math.log(class_docs[label] / total_docs) for label in classes},
+            "feature_log_prob": feature_log_prob,
+            "unseen_log_prob": unseen_log_prob,
+            "vocab": sorted(vocab),
+            "trained_samples": total_docs,
+        }
+        model["fingerprint"] = hashlib.sha1(json.dumps(model, sort_keys=True).encode("utf-8")).hexdigest()[:8]
+        return cls(model)
+
+    def predict(self, title, content):
+        """(카테고리, 확신도) 반환"""
+        features = extract_features(title, content)
+        length = sum(n for f, n in features.items() if f in self.vocab)
+        scores = {}
+        for label in self.classes:
+            log_probs = self.feature_log_prob[label]
+            unseen = self.unseen_log_prob[label]
+            score = self.class_log_prior[label]
+            for f, n in features.items():
+                if f in self.vocab:
+                    score += n * log_probs.get(f, unseen)
+            scores[label] = score
+
+        best = max(scores, key=scores.get)
+        # n-gram 로그우도 합을 그대로 softmax하면 특징 수가 많을수록 1.0에 몰리므로 특징 수로 나눠 정규화.
+        # 보정된 확률은 아니며, 임계값(calibrate)과 비교하는 순위 점수로만 사용
+        top = scores[best]
+        scale = max(length, 1)
+        norm = sum(math.exp((s - top) / scale) for s in scores.values())
+        return best, 1.0 / norm
+
+    def accepts(self, confidence):
+        """확신도가 보정된 임계값 이상이면 True"""
+        return self.threshold is not None and confidence >= self.threshold
+
+    def calibrate(self, samples, target_precision=None):
+        """
+        학습에 쓰지 않은 samples로 확신도 임계값을 정함. 임계값 이상 기사의 정확도가 target_precision 이상인
+        가장 낮은 임계값(=가장 많은 기사를 로컬에서 처리)을 선택하여 모델에 저장.
+        (threshold, 임계값 이상 정확도, 처리 비율) 반환. 만족하는 임계값이 없으면 threshold는 None.
+        """
+        target = LOCAL_CLASSIFIER_PRECISION if target_precision is None else target_precision
+        scored = []
+        for t, c, label in samples:
+            category, confidence = self.predict(t, c)
+            scored.append((confidence, category == label))
+        scored.sort(key=lambda x: -x[0])
+        threshold, precision, coverage = None, 0.0, 0.0
+        correct = 0
+        for i, (confidence, is_correct) in enumerate(scored, 1):
+            correct += is_correct
+            # 같은 확신도가 이어지면 묶음 끝에서만 판단
+            if i < len(scored) and scored[i][0] == confidence:
+                continue
+            if i >= MIN_CALIBRATION_SAMPLES and correct / i >= target:
+                threshold, precision, coverage = confidence, correct / i, i / len(scored)
+
+        self.threshold = threshold
+        self.model["threshold"] = threshold
+        self.model["calibration"] = {
+            "target_precision": target, "precision": precision, "coverage": coverage, "samples": len(scored),
+        }
+        return threshold, precision, coverage
+
+    def save(self, path=None):
+        with open(path or LOCAL_MODEL_PATH, "w", encoding="utf-8") as f:
+            json.dump(self.model, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path=None):
+        """저장된 모델이 없으면 None"""
+        path = path or LOCAL_MODEL_PATH
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                model = cls(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ 로컬 분류 모델을 불러오지 못했습니다 ({path}): {e}")
+            return None
+        if model.threshold is None:
+            print("⚠️ 로컬 분류 모델에 확신도 임계값이 없어(목표 정확도 미달 또는 이전 형식) 모든 기사를 Gemini로 분류합니다. (--train-local로 재학습)")
+        return model
+
+def _load_samples(store):
+    return [(row['title'], row['content'], row['category']) for row in store.llm_labelled_articles()]
+
+def _split(samples, holdout_buckets):
+    """제목 해시로 5등분해 holdout_buckets에 해당하는 기사를 따로 나눔 (실행마다 같은 분할 유지)"""
+    parts = {bucket: [] for bucket in holdout_buckets}
+    rest = []
+    for sample in samples:
+        bucket = int(hashlib.md5(sample[0].encode("utf-8")).hexdigest(), 16) % 5
+        parts.get(bucket, rest).append(sample)
+    return rest, [parts[bucket] for bucket in holdout_buckets]
+
+def _print_calibration(threshold, precision, coverage, target):
+    if threshold is None:
+        print(f"- 목표 정확도 {target:.0%}를 만족하는 확신도 임계값이 없습니다. 모든 기사를 Gemini로 분류합니다.")
+    else:
+        print(f"- 확신도 임계값: {threshold:.6f} (검증 정확도 {precision:.1%}, 로컬 처리 {coverage:.1%}, 목표 {target:.0%})")
+
+def train_local_classifier(store, path=None):
+    samples = _load_samples(store)
+    if len(samples) < 20:
+        print(f"학습 데이터가 부족합니다: {len(samples)}건 (LLM 분류 기사 20건 이상 필요)")
+        return None
+    started = time.perf_counter()
+    # 8:2로 나눠 학습 후 나머지 20%로 확신도 임계값을 보정 (보정한 모델 그대로 저장)
+    train, (calibration,) = _split(samples, [0])
+    if not train or not calibration:
+        print("검증 세트를 나눌 수 없습니다.")
+        return None
+    model = LocalClassifier.train(train)
+    threshold, precision, coverage = model.calibrate(calibration)
+    model.save(path)
+    counts = Counter(label for _, _, label in samples)
+    print(f"로컬 분류 모델 학습 완료: 학습 {len(train)}건 / 검증 {len(calibration)}건, {time.perf_counter() - started:.1f}초 ({model.version})")
+    _print_calibration(threshold, precision, coverage, LOCAL_CLASSIFIER_PRECISION)
+    for label, count in counts.most_common():
+        print(f"- {label}: {count}건")
+    return model
+
+def benchmark_local_classifier(store, target_precision=None):
+    """
+    LLM 분류 기사를 학습 3 : 검증 1 : 평가 1로 나눠 정확도와 분류 지연시간 측정.
+    검증 세트로 고른 확신도 임계값을 평가 세트에 적용한 정확도/처리 비율(=LLM 호출 절감 비율)도 함께 출력.
+    """
+    target = LOCAL_CLASSIFIER_PRECISION if target_precision is None else target_precision
+    samples = _load_samples(store)
+    if len(samples) < 20:
+        print(f"벤치마크 데이터가 부족합니다: {len(samples)}건")
+        return
+
+    train, (test, calibration) = _split(samples, [0, 1])
+    if not test or not train or not calibration:
+        print("평가 세트를 나눌 수 없습니다.")
+        return
+
+    model = LocalClassifier.train(train)
+    threshold, precision, coverage = model.calibrate(calibration, target)
+    correct = 0
+    confident = 0
+    confident_correct = 0
+    started = time.perf_counter()
+    predictions = [model.predict(t, c) for t, c, _ in test]
+    elapsed = time.perf_counter() - started
+
+    for (category, confidence), (_, _, label) in zip(predictions, test):
+        correct += category == label
+        if model.accepts(confidence):
+            confident += 1
+            confident_correct += category == label
+
+    n = len(test)
+    print(f"[로컬 분류기 벤치마크] 학습 {len(train)}건 / 검증 {len(calibration)}건 / 평가 {n}건")
+    print(f"- 전체 정확도: {correct / n:.1%}")
+    _print_calibration(threshold, precision, coverage, target)
+    if confident:
+        print(f"- 평가 세트 임계값 이상: {confident / n:.1%} 처리, 정확도 {confident_correct / confident:.1%}")
+    else:
+        print("- 평가 세트 임계값 이상: 0건")
+    print(f"- 평균 분류 시간: {elapsed / n * 1e6:.0f}µs/건")
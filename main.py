@@ -1,12 +1,23 @@
 import sys
 import argparse
-from scraper import search_naver_news, is_relevant_article, extract_article_details
-from notion_integrator import add_article_to_notion, update_article_in_notion, get_existing_article_page_id, check_database_exists, check_article_exists_by_title
+from scraper import search_naver_news, is_relevant_article
+from notion_integrator import update_article_in_notion, get_existing_article_page_id, check_database_exists, check_article_exists_by_title
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from classifier import classify_category_keyword, classify_type_keyword, llm_classifier
+from classifier import classify_category_keyword, classify_type_keyword, llm_classifier, local_classifier
+from local_classifier import train_local_classifier, benchmark_local_classifier
+from query_planner import QueryPlanner
+from url_dedup import RecentKeyCache, dedup_keys
+from profiler import profiler
+from parse_pool import ArticleParserPool, configure_workers
+from article_store import ArticleStore, STATUS_IRRELEVANT, STATUS_CLUSTERED, KEYWORD_CLASSIFIER_VERSION
+from story_cluster import StoryClusterer, build_daily_digest
+from notion_sync import NotionPublisher, publish_pending_articles
+from text_index import make_snippet
+from reclassify import run_reclassify
 
-def run_crawler(hours=24):
+def run_crawler(hours=24, seen_cache=None):
     print(f"[{datetime.now()}] 뉴스 크롤러 실행 (대상: 최근 {hours}시간)")
     
     kst = timezone(timedelta(hours=9))
@@ -14,7 +25,7 @@ def run_crawler(hours=24):
     start_date = now - timedelta(hours=hours)
     end_date = None
     
-    _execute_crawler(start_date, end_date, f"{hours}시간 이내")
+    _execute_crawler(start_date, end_date, f"{hours}시간 이내", seen_cache=seen_cache)
 
 def run_crawler_date(target_date_str):
     """
@@ -33,131 +44,247 @@ def run_crawler_date(target_date_str):
     
     _execute_crawler(start_date, end_date, target_date_str)
 
-def _execute_crawler(start_date, end_date, label):
+def _execute_crawler(start_date, end_date, label, seen_cache=None):
 
     if not check_database_exists():
         print("Notion 데이터베이스에 접근할 수 없습니다. ID와 토큰을 확인하세요.")
         return
 
     queries = ["1형 당뇨", "1형당뇨", "소아당뇨", "췌장장애"]
-    all_articles = []
     
-    # 1. 키워드별 뉴스 검색
-    for query in queries:
-        print(f"'{query}' 검색 중...")
-        for start_idx in range(1, 1001, 100):
-            articles = search_naver_news(query, start=start_idx)
-            if not articles: break
-            all_articles.extend(articles)
-            # If we reached articles older than start_date in 'date' sort, we could break.
-            # But search_naver_news uses default sort (sim or date). main calls it without sort.
-            # search_naver_news default is 'date'.
-            last_dt = datetime.strptime(articles[-1]['pubDate'], "%a, %d %b %Y %H:%M:%S %z")
-            if last_dt < start_date:
-                break
-            time.sleep(0.3)
-
-    # 1. 링크 기반 중복 제거
-    seen_links = set()
-    unique_articles = []
-    for a in all_articles:
-        if a['link'] not in seen_links:
-            seen_links.add(a['link'])
-            unique_articles.append(a)
+    # 1. 키워드별 뉴스 검색 (링크 기반 중복 제거 및 쿼리 확장 포함)
+    planner = QueryPlanner(search_naver_news, delay=0.3, seen_cache=seen_cache)
+    unique_articles = planner.collect(queries, sort_methods=["date"], start_date=start_date)
 
     # 2. 날짜 필터링
-    recent_articles = []
-    for a in unique_articles:
-        try:
-            pub_dt = datetime.strptime(a.get('pubDate', ''), "%a, %d %b %Y %H:%M:%S %z")
-            if end_date:
-                if start_date <= pub_dt <= end_date:
+    with profiler.stage("date_filter"):
+        recent_articles = []
+        for a in unique_articles:
+            try:
+                pub_dt = datetime.strptime(a.get('pubDate', ''), "%a, %d %b %Y %H:%M:%S %z")
+                if end_date:
+                    if start_date <= pub_dt <= end_date:
+                        recent_articles.append(a)
+                elif pub_dt >= start_date:
                     recent_articles.append(a)
-            elif pub_dt >= start_date:
-                recent_articles.append(a)
-        except:
-            pass
+            except:
+                pass
             
     print(f"검색된 기사: {len(unique_articles)}개 -> {len(recent_articles)}개 ({label})")
 
-    count_new = 0
-    count_skipped = 0
+    published, failed, skipped = _process_articles(recent_articles)
+    print(f"작업 완료! 신규: {published}개, 게시 실패: {failed}개, 중복/건너뜀: {skipped}개")
+
+def _classify(title, content, link=None):
+    with profiler.article(link), profiler.stage("classify"):
+        return _classify_article(title, content)
+
+def _classify_article(title, content):
+    """
+    로컬 분류기(확신도 높은 경우) -> LLM -> 키워드 분류 순으로 시도.
+    (category, summary, classifier_version) 반환. 로컬 분류 시 요약은 비워 두어 Notion에는 네이버 설명이 표시됨.
+    """
+    if local_classifier:
+        category, confidence = local_classifier.predict(title, content)
+        if local_classifier.accepts(confidence):
+            return category, "", local_classifier.version
+    
+    llm_result = llm_classifier.classify_article(title, content)
+    if llm_result:
+        return llm_result.get("category", "기타"), llm_result.get("summary", ""), llm_result["classifier_version"]
+    print(f" -> LLM 분류 실패, 키워드 분류 사용: {title[:30]}...")
+    return classify_category_keyword(f"{title} {content}"), "", KEYWORD_CLASSIFIER_VERSION
+
+def _save_classified(store, publisher, entry):
+    """
+    대표 기사의 분류 결과를 저장하고 게시를 예약. entry는 article, details, future, members(같은 사건 기사),
+    saved(저장 후 article id, 관련없음이면 False)를 가짐.
+    """
+    a, details = entry["article"], entry["details"]
+    title = a['title']
+    profiler.switch_article(a['link'])
+    with profiler.stage("wait"):
+        category, summary, classifier_version = entry["future"].result()
     
-    processed_titles = []
+    # LLM이 "관련없음"으로 분류했으면 같은 사건 기사와 함께 스킵
+    if category == "관련없음":
+        print(f" -> LLM이 '관련없음'으로 분류했습니다: {title[:30]}...")
+        store.save_article(a, details, category=category, summary=summary, status=STATUS_IRRELEVANT, classifier_version=classifier_version)
+        for member, member_details in entry["members"]:
+            store.save_article(member, member_details, status=STATUS_IRRELEVANT)
+        entry["saved"] = False
+        return
     
-    for i, a in enumerate(recent_articles):
-        link = a['link']
-        title = a['title']
-        
-        # [중복 방지 0] 연예 뉴스 제외
-        if "entertain.naver.com" in link:
-             print(f"[{i+1}/{len(recent_articles)}] 연예 뉴스 제외 (entertain.naver.com): {title[:30]}...")
-             count_skipped += 1
-             continue
+    print(f" -> 분류: {category} - {title[:30]}...")
+    print(f" -> 요약: {summary[:30]}...")
+    
+    # 로컬 저장소에 기록 후 Notion 게시는 백그라운드로 처리 (유형은 이제 사용하지 않으므로 게시 시 '뉴스'로 통일)
+    # 같은 사건 기사를 먼저 묶음에 넣어 두어 게시 한 번에 모든 언론사가 기록되도록 함
+    article_id = store.save_article(a, details, category=category, summary=summary, classifier_version=classifier_version)
+    store.start_cluster(article_id)
+    for member, member_details in entry["members"]:
+        member_id = store.save_article(member, member_details, status=STATUS_CLUSTERED)
+        store.add_to_cluster(member_id, article_id)
+    publisher.submit(article_id)
+    entry["saved"] = article_id
 
-        print(f"[{i+1}/{len(recent_articles)}] 분석 중: {title[:30]}...")
-        
-        # [중복 방지 1] 제목으로 Notion 중복 확인 (Exact Match)
-        if check_article_exists_by_title(title):
-            print(" -> 이미 Notion에 존재하는 기사(제목 중복)입니다. 건너뜁니다.")
-            count_skipped += 1
-            continue
-            
-        # [중복 방지 2] LLM 의미 기반 중복 확인 (Semantic Match)
-        is_duplicate, similar_title = llm_classifier.check_similarity(title, processed_titles)
-        if is_duplicate:
-            print(f" -> 유사한 기사가 이미 처리되었습니다. (유사 제목: {similar_title}) 건너뜁니다.")
-            count_skipped += 1
-            continue
+def _add_run_member(store, publisher, entry, a, details):
+    """이번 실행의 대표 기사 묶음에 같은 사건 기사 추가. 대표 기사가 이미 저장되었으면 바로 기록."""
+    if entry["saved"] is None:
+        entry["members"].append((a, details))
+    elif entry["saved"] is False:
+        store.save_article(a, details, status=STATUS_IRRELEVANT)
+    else:
+        member_id = store.save_article(a, details, status=STATUS_CLUSTERED)
+        store.add_to_cluster(member_id, entry["saved"])
+        publisher.submit_presses(entry["saved"])
 
-        processed_titles.append(title) 
+def _process_articles(articles):
+    """
+    검색 결과를 중복 확인 -> 본문 추출 -> 관련성 확인 -> 분류 순으로 처리하여 로컬 저장소에 기록하고
+    Notion 게시는 백그라운드 publisher로 넘김. (게시 성공, 게시 실패, 중복/건너뜀) 건수를 반환.
+    본문 추출은 ArticleParserPool에서 병렬로, LLM 분류는 스레드 풀에서 동시에 실행되어 서로 겹쳐 진행됨.
+    """
+    count_skipped = 0
+    run_urls = set() # 이번 실행에서 처리한 정규화 URL
+    run_titles = {} # 이번 실행에서 본 제목 -> 그 기사가 속한 사건 (대표 기사 등록 전이면 None)
+    candidates = [] # (article, 같은 제목으로 정해진 사건) 중복 확인을 통과해 본문 추출 대상인 기사
+    classified = [] # 이번 실행의 대표 기사 (_save_classified 참고)
+    unsaved = [] # 분류 결과를 아직 저장하지 않은 대표 기사
+    count_clustered = 0
+    total = len(articles)
+    
+    # 사용량 리포트는 실행별로 집계 (--loop에서 누적되지 않도록)
+    llm_classifier.reset_usage()
+    
+    store = ArticleStore()
+    publisher = NotionPublisher(store.path).start()
+    clusterer = StoryClusterer(store)
+    # 이전 실행에서 게시/언론사 갱신에 실패한 기사도 함께 재시도
+    for row in store.pending_articles():
+        publisher.submit(row['id'])
+    for row in store.unsynced_clusters():
+        publisher.submit_presses(row['id'])
+    
+    with ThreadPoolExecutor(max_workers=llm_classifier.max_concurrency) as executor:
+        for i, a in enumerate(articles):
+            link = a['link']
+            title = a['title']
+            profiler.switch_article(link)
+            
+            # [중복 방지 0] 연예 뉴스 제외
+            if "entertain.naver.com" in link:
+                print(f"[{i+1}/{total}] 연예 뉴스 제외 (entertain.naver.com): {title[:30]}...")
+                count_skipped += 1
+                continue
 
-        details = extract_article_details(link)
-        
-        # Strict Relevance Check (Title or 2+ mentions) - already in scraper.is_relevant_article
-        # But let's check classifier result too.
-        
-        if not is_relevant_article(a, content=details['content']):
-            print(f" -> 관련 없는 기사로 판단되어 건너뜁니다. (키워드 부족 - 제목: '{title}', 본문길이: {len(details['content'])})")
-            continue
+            print(f"[{i+1}/{total}] 분석 중: {title[:30]}...")
             
-        # [분류 및 요약]
-        llm_result = llm_classifier.classify_article(title, details['content'])
-        
-        category = "기타"
-        news_type = "기타"
-        summary = ""
-        
-        if llm_result:
-            category = llm_result.get("category", "기타")
-            summary = llm_result.get("summary", "")
-        else:
-            print(" -> LLM 분류 실패, 키워드 분류 시도...")
-            full_text = f"{title} {details['content']}"
-            category = classify_category_keyword(full_text)
+            # [중복 방지 1] 이번 실행 또는 로컬 저장소에서 이미 처리한 기사인지 확인 (정규화 URL)
+            with profiler.stage("dedup"):
+                keys = dedup_keys(a)
+                seen = not run_urls.isdisjoint(keys) or store.has_url(a)
+                run_urls.update(keys)
+                same_title = None if seen else store.find_by_title(title)
+            if seen:
+                print(" -> 이미 처리된 기사(로컬 DB 또는 이번 실행)입니다. 건너뜁니다.")
+                count_skipped += 1
+                continue
             
-        # LLM이 "관련없음"으로 분류했으면 스킵
-        if category == "관련없음":
-             print(" -> LLM이 '관련없음'으로 분류했습니다. 건너뜁니다.")
-             continue
-        
-        # 유형은 이제 사용하지 않으므로 '뉴스'로 통일 (또는 빈 값)
-        news_type = "뉴스"
-        
-        print(f" -> 분류: {category}")
-        print(f" -> 요약: {summary[:30]}...")
-        
-        success = add_article_to_notion(
-            title=title, link=link, date=a['pubDate'], description=a['description'],
-            category=category, type=news_type, press=details['company'],
-            full_content=details['content'], mentions=details['mentions'],
-            summary=summary
-        )
-        if success: count_new += 1
-        
-        time.sleep(0.5)
+            # 제목은 같고 URL이 다르면 다른 언론사의 같은 기사이므로 건너뛰지 않고 사건 묶음에 추가 (언론사 기록)
+            if same_title is not None:
+                if same_title['status'] == STATUS_IRRELEVANT:
+                    print(" -> 같은 제목의 기사가 관련 없음으로 처리되었습니다. 건너뜁니다.")
+                    count_skipped += 1
+                    continue
+                if same_title['cluster_id'] is None:
+                    store.start_cluster(same_title['id'])
+                candidates.append((a, ("stored", same_title['cluster_id'] or same_title['id'])))
+                continue
+            if title in run_titles:
+                candidates.append((a, ("title", title)))
+                continue
+            
+            # 로컬 저장소에 없는 경우에만 Notion 제목 중복 확인 (Exact Match)
+            with profiler.stage("notion_dedup"):
+                exists_in_notion = check_article_exists_by_title(title)
+            if exists_in_notion:
+                print(" -> 이미 Notion에 존재하는 기사(제목 중복)입니다. 건너뜁니다.")
+                count_skipped += 1
+                continue
+                
+            run_titles[title] = None
+            candidates.append((a, None))
+
+        # 본문 추출: 다운로드(스레드)와 파싱(프로세스 풀)을 병렬로 진행하고 결과는 원래 순서대로 처리
+        with ArticleParserPool() as parser:
+            extracted = parser.iter_details(a['link'] for a, _ in candidates)
+            for a, title_story in candidates:
+                # 그 사이 분류가 끝난 대표 기사부터 저장/게시 (중간에 중단되어도 이미 받은 분류 결과는 남음)
+                for entry in unsaved:
+                    if entry["future"].done():
+                        _save_classified(store, publisher, entry)
+                unsaved = [entry for entry in unsaved if entry["saved"] is None]
+                
+                link = a['link']
+                title = a['title']
+                # 본문 추출 대기 시간이 이전 기사에 더해지지 않도록 기다리기 전에 기사 전환
+                profiler.switch_article(link)
+                with profiler.stage("wait"):
+                    _, details = next(extracted)
+                
+                if title_story is None:
+                    if not is_relevant_article(a, content=details['content']):
+                        print(f" -> 관련 없는 기사로 판단되어 건너뜁니다. (키워드 부족 - 제목: '{title}', 본문길이: {len(details['content'])})")
+                        store.save_article(a, details, status=STATUS_IRRELEVANT)
+                        continue
+                    
+                    # [중복 방지 2] 같은 사건의 다른 언론사 보도면 대표 기사 묶음에 추가 (분류/Notion 페이지 생성 생략)
+                    with profiler.stage("cluster"):
+                        story = clusterer.find_story(a)
+                    run_titles[title] = story
+                elif title_story[0] == "title":
+                    # 이번 실행의 같은 제목 기사가 속한 사건. 그 기사가 관련 없음이었으면 함께 제외
+                    story = run_titles[title_story[1]]
+                    if story is None:
+                        print(" -> 같은 제목의 기사가 관련 없음으로 처리되었습니다. 건너뜁니다.")
+                        store.save_article(a, details, status=STATUS_IRRELEVANT)
+                        continue
+                else:
+                    story = title_story
+                
+                if story:
+                    kind, key = story
+                    count_clustered += 1
+                    if kind == "stored":
+                        article_id = store.save_article(a, details, status=STATUS_CLUSTERED)
+                        store.add_to_cluster(article_id, key)
+                        publisher.submit_presses(key)
+                        print(f" -> 같은 사건의 기존 기사에 언론사 추가: {details['company']}")
+                    else:
+                        _add_run_member(store, publisher, classified[key], a, details)
+                        print(f" -> 같은 사건의 기사(이번 실행)에 언론사 추가: {details['company']}")
+                    continue
+                
+                # [분류 및 요약] 결과는 분류가 끝나는 대로 저장
+                clusterer.add_run_story(len(classified), a)
+                run_titles[title] = ("run", len(classified))
+                entry = {
+                    "article": a, "details": details, "members": [], "saved": None,
+                    "future": executor.submit(_classify, title, details['content'], link),
+                }
+                classified.append(entry)
+                unsaved.append(entry)
+
+        for entry in unsaved:
+            _save_classified(store, publisher, entry)
+        profiler.end_article()
             
-    print(f"작업 완료! 신규: {count_new}개, 중복/건너뜀: {count_skipped}개")
+    publisher.close()
+    store.close()
+    print(f"같은 사건 묶음으로 처리: {count_clustered}건")
+    llm_classifier.print_usage_report()
+    return publisher.published, publisher.failed, count_skipped
 
 def run_crawler_year(year):
     print(f"=== {year}년도 전체 데이터 수집 시작 ===")
@@ -174,131 +301,70 @@ def run_crawler_year(year):
     queries = ["1형 당뇨", "1형당뇨", "소아당뇨", "췌장장애"]
     sort_methods = ["date", "sim"] # 최신순, 관련도순 교차 수집
     
-    all_raw_articles = []
-    
-    # 2. 수집 (쿼리 x 정렬 x 페이지)
-    for query in queries:
-        for sort in sort_methods:
-            print(f"검색 중: '{query}' (정렬: {sort})...")
-            # 네이버 API 최대 1000개 제한
-            for start_idx in range(1, 1001, 100):
-                articles = search_naver_news(query, display=100, start=start_idx, sort=sort)
-                if not articles: break
-                
-                # 날짜 체크 (date 정렬일 때 너무 과거로 가면 중단)
-                if sort == 'date':
-                    last_item_date = datetime.strptime(articles[-1]['pubDate'], "%a, %d %b %Y %H:%M:%S %z")
-                    if last_item_date < start_date:
-                        # 이번 페이지에 유효한게 있는지 확인 후 추가하고 break
-                        valid_page = [a for a in articles if datetime.strptime(a['pubDate'], "%a, %d %b %Y %H:%M:%S %z") >= start_date]
-                        all_raw_articles.extend(valid_page)
-                        break
-                
-                all_raw_articles.extend(articles)
-                time.sleep(0.1)
-
-    # 3. 중복 제거 (링크 기준)
-    seen_links = set()
-    unique_articles = []
-    for a in all_raw_articles:
-        if a['link'] not in seen_links:
-            seen_links.add(a['link'])
-            unique_articles.append(a)
+    # 2. 수집 (쿼리 x 정렬 x 페이지, 네이버 API 최대 1000개 제한은 쿼리 확장으로 보완)
+    # 3. 중복 제거 (링크 기준) - QueryPlanner가 수집과 함께 처리
+    planner = QueryPlanner(search_naver_news, delay=0.1)
+    unique_articles = planner.collect(queries, sort_methods=sort_methods, start_date=start_date)
             
     # 4. 날짜 필터링 (정확히 해당 연도만)
-    target_articles = []
-    for a in unique_articles:
-        try:
-            pub_dt = datetime.strptime(a.get('pubDate', ''), "%a, %d %b %Y %H:%M:%S %z")
-            if start_date <= pub_dt <= end_date:
-                target_articles.append(a)
-        except:
-            pass
+    with profiler.stage("date_filter"):
+        target_articles = []
+        for a in unique_articles:
+            try:
+                pub_dt = datetime.strptime(a.get('pubDate', ''), "%a, %d %b %Y %H:%M:%S %z")
+                if start_date <= pub_dt <= end_date:
+                    target_articles.append(a)
+            except:
+                pass
             
     print(f"수집 완료: 총 {len(unique_articles)}개 중 {year}년 기사 {len(target_articles)}개 확정")
     
     # 날짜순 정렬 (과거 -> 최신)
-    target_articles.sort(key=lambda x: datetime.strptime(x['pubDate'], "%a, %d %b %Y %H:%M:%S %z"))
+    with profiler.stage("date_filter"):
+        target_articles.sort(key=lambda x: datetime.strptime(x['pubDate'], "%a, %d %b %Y %H:%M:%S %z"))
 
-    count_new = 0
-    count_skipped = 0
-    processed_titles = [] # 이번 세션에서 처리한 제목들 (중복 방지용)
-    
     # 5. 처리 및 저장
-    total = len(target_articles)
-    for i, a in enumerate(target_articles):
-        link = a['link']
-        title = a['title']
-        
-        if "entertain.naver.com" in link:
-            print(f"[{i+1}/{total}] 연예 뉴스 제외: {title[:30]}...")
-            count_skipped += 1
-            continue
+    published, failed, skipped = _process_articles(target_articles)
+    print(f"=== {year}년 처리 완료: 신규 {published}건, 게시 실패 {failed}건, 중복/제외 {skipped}건 ===")
 
-        print(f"[{i+1}/{total}] 처리 중 ({a['pubDate'][:16]}): {title[:30]}...")
-        
-        # Notion 중복 확인 (제목)
-        if check_article_exists_by_title(title):
-            print(" -> Notion 중복 (건너뜀)")
-            count_skipped += 1
-            continue
-            
-        # 세션 내 중복 확인 (제목)
-        if title in processed_titles:
-            print(" -> 세션 내 중복 (건너뜀)")
-            count_skipped += 1
-            continue
-            
-        # LLM 유사도 체크 (API 비용 절약을 위해, 리스트가 너무 길면 최근 50개만 비교 등 최적화 필요)
-        # 1년치는 너무 많으므로, 최근 30개 정도와 비교하거나, 날짜가 비슷한 것끼리 비교해야 함.
-        # 여기서는 간단히 패스하거나, 최근 처리한 20개와만 비교
-        recent_titles = processed_titles[-20:] if len(processed_titles) > 20 else processed_titles
-        is_duplicate, similar_title = llm_classifier.check_similarity(title, recent_titles)
-        if is_duplicate:
-            print(f" -> 유사 기사 존재 (유사: {similar_title})")
-            count_skipped += 1
-            continue
-
-        details = extract_article_details(link)
-        
-        # 키워드 관련성 체크 (Scraper 로직 사용)
-        if not is_relevant_article(a, content=details['content']):
-            print(" -> 관련성 부족 (건너뜀)")
-            continue
-            
-        # 분류 및 요약
-        llm_result = llm_classifier.classify_article(title, details['content'])
-        
-        if llm_result:
-            category = llm_result.get("category", "기타")
-            summary = llm_result.get("summary", "")
-        else:
-            full_text = f"{title} {details['content']}"
-            category = classify_category_keyword(full_text)
-            summary = ""
-
-        if category == "관련없음":
-            print(" -> LLM 분류: 관련없음")
-            continue
-        
-        # 유형은 이제 사용하지 않으므로 '뉴스'로 통일
-        news_type = "뉴스"
-        
-        print(f" -> 등록: {category}")
-        
-        success = add_article_to_notion(
-            title=title, link=link, date=a['pubDate'], description=a['description'],
-            category=category, type=news_type, press=details['company'],
-            full_content=details['content'], mentions=details['mentions'],
-            summary=summary
-        )
-        if success:
-            count_new += 1
-            processed_titles.append(title)
-        
-        time.sleep(0.5)
+def run_sync(republish=False):
+    """로컬 저장소의 게시 대기 기사를 Notion에 게시. republish=True면 게시 완료 기사도 다시 게시."""
+    if not check_database_exists():
+        print("Notion 데이터베이스에 접근할 수 없습니다. ID와 토큰을 확인하세요.")
+        return
+    
+    with ArticleStore() as store:
+        if republish:
+            count = store.reset_publication()
+            print(f"게시 상태 초기화: {count}건 (새 Notion 데이터베이스로 재게시)")
+        count = publish_pending_articles(store)
+        print(f"Notion 동기화 완료: {count}건 게시")
+
+def run_search(query, category=None, since=None, until=None, limit=20):
+    with ArticleStore() as store:
+        started = time.perf_counter()
+        try:
+            results = store.search(query, category=category, since=since, until=until, limit=limit)
+        except ValueError as e:
+            print(f"날짜 형식이 잘못되었습니다 (YYYY-MM-DD): {e}")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
         
-    print(f"=== {year}년 처리 완료: 신규 {count_new}건, 중복/제외 {count_skipped}건 ===")
+        print(f"'{query}' 검색 결과: {len(results)}건 ({elapsed_ms:.1f}ms)")
+        for i, row in enumerate(results):
+            print(f"{i+1}. [{row['category'] or '-'}] {row['title']} ({row['press']}, {(row['pub_date'] or '')[:10]})")
+            print(f"   {make_snippet(row['content'], query)}")
+            print(f"   {row['link']}")
+
+def run_digest(day, output=None):
+    with ArticleStore() as store:
+        digest = build_daily_digest(store, day)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(digest)
+        print(f"다이제스트 저장: {output}")
+    else:
+        print(digest)
 
 def main():
     parser = argparse.ArgumentParser(description="News Crawler for Type 1 Diabetes")
@@ -307,8 +373,64 @@ def main():
     parser.add_argument("--year", type=int, help="Scrape data for a specific year (e.g., 2026)")
     parser.add_argument("--date", type=str, help="Scrape data for a specific date (YYYY-MM-DD)")
     parser.add_argument("--hours", type=int, help="Scrape data for the last N hours")
+    parser.add_argument("--sync", action="store_true", help="Publish pending articles from the local store to Notion")
+    parser.add_argument("--republish", action="store_true", help="Re-publish every stored article to the configured Notion database")
+    parser.add_argument("--search", type=str, help="Full-text search over locally stored articles")
+    parser.add_argument("--category", type=str, help="Filter --search results by category (e.g., 의학/연구)")
+    parser.add_argument("--since", type=str, help="Filter --search results from this date (YYYY-MM-DD)")
+    parser.add_argument("--until", type=str, help="Filter --search results up to this date (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of --search results")
+    parser.add_argument("--reclassify", action="store_true", help="Re-classify stored articles classified with an older LLM model/prompt")
+    parser.add_argument("--batch-size", type=int, default=20, help="Articles per --reclassify batch")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent LLM requests for --reclassify")
+    parser.add_argument("--include-local", action="store_true", help="Also send articles classified by the local classifier to Gemini in --reclassify")
+    parser.add_argument("--digest", type=str, help="Print the daily story digest for a date (YYYY-MM-DD)")
+    parser.add_argument("--digest-out", type=str, help="Write the --digest output to this file instead of stdout")
+    parser.add_argument("--fetch-workers", type=int, help="Concurrent article page downloads (default: FETCH_WORKERS or 4)")
+    parser.add_argument("--parse-workers", type=int, help="Processes for HTML parsing; 0 parses in the download threads (default: PARSE_WORKERS or 0). With --profile, parsing in processes is timed as a single 'parse' stage without sampled stacks")
+    parser.add_argument("--profile", action="store_true", help="Profile the run and write flamegraph-ready collapsed stacks")
+    parser.add_argument("--profile-out", type=str, default="profile.collapsed", help="Collapsed-stack output path for --profile")
+    parser.add_argument("--profile-top", type=int, default=10, help="Number of slowest articles/domains to list for --profile")
+    parser.add_argument("--train-local", action="store_true", help="Train the local classifier from LLM-labelled articles")
+    parser.add_argument("--bench-local", action="store_true", help="Report local classifier accuracy and latency on a holdout split")
     
     args = parser.parse_args()
+    configure_workers(fetch_workers=args.fetch_workers, parse_workers=args.parse_workers)
+
+    if args.profile:
+        profiler.enable()
+    try:
+        _dispatch(args)
+    finally:
+        if args.profile:
+            profiler.disable()
+            profiler.write_collapsed(args.profile_out)
+            profiler.print_report(top_n=args.profile_top)
+
+def _dispatch(args):
+    if args.search:
+        run_search(args.search, category=args.category, since=args.since, until=args.until, limit=args.limit)
+        return
+
+    if args.digest:
+        run_digest(args.digest, output=args.digest_out)
+        return
+
+    if args.train_local or args.bench_local:
+        with ArticleStore() as store:
+            if args.train_local:
+                train_local_classifier(store)
+            if args.bench_local:
+                benchmark_local_classifier(store)
+        return
+
+    if args.reclassify:
+        run_reclassify(batch_size=args.batch_size, workers=args.workers, include_local=args.include_local)
+        return
+
+    if args.sync or args.republish:
+        run_sync(republish=args.republish)
+        return
 
     if args.date:
         run_crawler_date(args.date)
@@ -332,15 +454,18 @@ def main():
         print("=== 1시간 간격 연속 크롤링 모드 시작 ===")
         print("첫 실행은 최근 24시간 데이터를 수집하고, 이후에는 2시간 데이터를 수집합니다.")
         
+        # 실행 간 중복 확인 캐시 (크기/기간 제한으로 메모리 사용량 일정)
+        seen_cache = RecentKeyCache()
+        
         # 첫 실행: 24시간
-        run_crawler(hours=24)
+        run_crawler(hours=24, seen_cache=seen_cache)
         
         while True:
             print("\n다음 실행까지 1시간 대기 중...", flush=True)
             time.sleep(3600)
             
-            # 이후 실행: 2시간 (안전하게 중복 범위 포함)
-            run_crawler(hours=2)
+            # 이후 실행: 2시간 (안전하게 중복 범위 포함, 이미 본 기사는 캐시에서 걸러짐)
+            run_crawler(hours=2, seen_cache=seen_cache)
     else:
         # 단일 실행 (기본 24시간)
         run_crawler(hours=24)
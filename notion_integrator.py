@@ -3,6 +3,7 @@ import httpx
 from dotenv import load_dotenv
 from datetime import datetime
 import html
+from notion_schema import NotionSchema
 
 load_dotenv()
 
@@ -16,9 +17,14 @@ def clean_text(text):
     return html.unescape(text)
 
 def parse_naver_date(date_str):
+    # 네이버 pubDate 형식과 로컬 저장소의 ISO 형식을 모두 허용
     try:
         dt = datetime.strptime(date_str, "%a, %d %b %Y %H:%M:%S %z")
         return dt.strftime("%Y-%m-%d")
+    except:
+        pass
+    try:
+        return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
     except:
         return datetime.now().strftime("%Y-%m-%d")
 
@@ -29,6 +35,14 @@ def get_headers():
         "Content-Type": "application/json"
     }
 
+# 실행당 한 번 가져오는 데이터베이스 스키마 (check_database_exists에서 갱신)
+database_schema = NotionSchema(NOTION_DATABASE_ID, get_headers)
+
+def press_options(press):
+    """'언론사' multi_select 값. 같은 사건 묶음이면 여러 언론사 목록을 받음 (Notion 옵션 이름에는 쉼표 불가)"""
+    presses = press if isinstance(press, list) else [press]
+    return [{"name": p.replace(",", " ")} for p in presses if p]
+
 def add_article_to_notion(title, link, date, description, category="기타", type="기타", press="정보 없음", full_content="", mentions="", summary=""):
     try:
         formatted_date = parse_naver_date(date)
@@ -40,24 +54,28 @@ def add_article_to_notion(title, link, date, description, category="기타", typ
             "날짜": {"date": {"start": formatted_date}},
             "분야": {"select": {"name": category}},
             "유형": {"select": {"name": type}},
-            "언론사": {"multi_select": [{"name": press}]}
+            "언론사": {"multi_select": press_options(press)}
         }
         
         children = generate_children_blocks(description, link, mentions, summary) # summary 전달
 
         payload = {
             "parent": {"database_id": NOTION_DATABASE_ID},
-            "properties": properties, "children": children
+            "properties": database_schema.prepare(properties), "children": children
         }
         
         with httpx.Client() as client:
             response = client.post(url, headers=get_headers(), json=payload)
             if response.status_code != 200:
                 print(f"Failed to add to Notion. Status: {response.status_code}, Body: {response.text}")
-            return response.status_code == 200
+                if response.status_code == 400:
+                    database_schema.invalidate()
+                return None
+            # 생성된 페이지 ID 반환 (로컬 저장소에 게시 상태 기록용)
+            return response.json().get("id")
     except Exception as e:
         print(f"Error adding to Notion: {e}")
-        return False
+        return None
 
 def update_article_in_notion(page_id, title, link, date, category, type, full_content, mentions=""):
     try:
@@ -69,7 +87,7 @@ def update_article_in_notion(page_id, title, link, date, category, type, full_co
         }
         
         with httpx.Client() as client:
-            client.patch(url, headers=get_headers(), json={"properties": properties})
+            client.patch(url, headers=get_headers(), json={"properties": database_schema.prepare(properties)})
             
             content_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
             children = generate_children_blocks("", link, mentions) # link를 전달
@@ -80,10 +98,76 @@ def update_article_in_notion(page_id, title, link, date, category, type, full_co
         print(f"Error updating Notion: {e}")
         return False
 
+def update_article_classification(page_id, category, summary=""):
+    """재분류 결과 반영: '분야' 속성과 '💡 핵심 요약' 문단만 갱신"""
+    try:
+        with httpx.Client() as client:
+            response = client.patch(
+                f"https://api.notion.com/v1/pages/{page_id}", headers=get_headers(),
+                json={"properties": database_schema.prepare({"분야": {"select": {"name": category}}})}
+            )
+            if response.status_code != 200:
+                print(f"Failed to update category. Status: {response.status_code}, Body: {response.text}")
+                return False
+            if not summary:
+                return True
+            
+            # 요약 제목 블록 바로 다음 문단 블록을 찾아 내용 교체
+            response = client.get(f"https://api.notion.com/v1/blocks/{page_id}/children", headers=get_headers())
+            if response.status_code != 200:
+                return False
+            blocks = response.json().get("results", [])
+            for i, block in enumerate(blocks[:-1]):
+                if block.get("type") != "heading_3":
+                    continue
+                heading = "".join(t.get("plain_text", "") for t in block["heading_3"].get("rich_text", []))
+                if "핵심 요약" in heading and blocks[i + 1].get("type") == "paragraph":
+                    response = client.patch(
+                        f"https://api.notion.com/v1/blocks/{blocks[i + 1]['id']}", headers=get_headers(),
+                        json={"paragraph": {"rich_text": [{"type": "text", "text": {"content": clean_text(summary)}}]}}
+                    )
+                    return response.status_code == 200
+            
+            # 요약 없이 생성된 페이지(요약/설명 모두 비어 있음)는 요약 블록을 새로 추가
+            response = client.patch(
+                f"https://api.notion.com/v1/blocks/{page_id}/children", headers=get_headers(),
+                json={"children": generate_children_blocks("", None, "", summary)}
+            )
+            if response.status_code != 200:
+                print(f"Failed to append summary. Status: {response.status_code}, Body: {response.text}")
+            return response.status_code == 200
+    except Exception as e:
+        print(f"Error updating classification in Notion: {e}")
+        return False
+
+def update_article_presses(page_id, presses):
+    """같은 사건의 다른 언론사 보도를 대표 페이지 '언론사'에 반영"""
+    try:
+        with httpx.Client() as client:
+            response = client.patch(
+                f"https://api.notion.com/v1/pages/{page_id}", headers=get_headers(),
+                json={"properties": database_schema.prepare({"언론사": {"multi_select": press_options(presses)}})}
+            )
+            if response.status_code != 200:
+                print(f"Failed to update presses. Status: {response.status_code}, Body: {response.text}")
+            return response.status_code == 200
+    except Exception as e:
+        print(f"Error updating presses in Notion: {e}")
+        return False
+
+def archive_notion_page(page_id):
+    try:
+        with httpx.Client() as client:
+            response = client.patch(f"https://api.notion.com/v1/pages/{page_id}", headers=get_headers(), json={"archived": True})
+            return response.status_code == 200
+    except Exception as e:
+        print(f"Error archiving Notion page: {e}")
+        return False
+
 def check_article_exists_by_title(title):
     try:
         url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}/query"
-        payload = {"filter": {"property": "이름", "title": {"equals": clean_text(title)}}}
+        payload = {"filter": {"property": database_schema.title_property, "title": {"equals": clean_text(title)}}}
         with httpx.Client() as client:
             response = client.post(url, headers=get_headers(), json=payload)
             if response.status_code == 200:
@@ -145,9 +229,5 @@ def get_existing_article_page_id(link):
     except: return None
 
 def check_database_exists():
-    try:
-        url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}"
-        with httpx.Client() as client:
-            response = client.get(url, headers=get_headers())
-            return response.status_code == 200
-    except: return False
+    # 접근 확인과 함께 스키마를 새로 가져옴 (실행마다 한 번)
+    return database_schema.load(refresh=True)
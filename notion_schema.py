@@ -0,0 +1,204 @@
+import threading
+import httpx
+
+# 코드가 기록하는 속성과 타입. 제목 속성은 이름과 관계없이 데이터베이스의 title 속성을 사용.
+REQUIRED_PROPERTIES = {
+    "이름": "title",
+    "URL": "url",
+    "날짜": "date",
+    "분야": "select",
+    "유형": "select",
+    "언론사": "multi_select",
+}
+TITLE_PROPERTY = "이름"
+
+# Notion API 제한
+MAX_OPTION_LENGTH = 100
+MAX_TEXT_LENGTH = 2000
+MAX_URL_LENGTH = 2000
+
+def option_name(name):
+    """select/multi_select 옵션 이름 정리 (쉼표 불가, 100자 제한)"""
+    return str(name).replace(",", " ").strip()[:MAX_OPTION_LENGTH] if name else ""
+
+def _truncate_text(items):
+    for item in items:
+        text = item.get("text")
+        if text and len(text.get("content", "")) > MAX_TEXT_LENGTH:
+            text["content"] = text["content"][:MAX_TEXT_LENGTH]
+    return items
+
+class NotionSchema:
+    """
+    Notion 데이터베이스 스키마 캐시.
+    - load()로 실행당 한 번 속성 목록과 select/multi_select 옵션을 가져옴
+    - prepare()는 보낼 properties를 스키마 기준으로 검증/정리하여 400 응답으로 버려지는 요청을 미리 막음
+      (없는 속성/타입 불일치는 제외, 제목 속성 이름 보정, 길이 제한 적용)
+    - 없는 옵션은 ensure_options()가 데이터베이스 PATCH 한 번으로 모아서 생성
+    게시 스레드와 크롤링 스레드가 함께 쓰므로 lock으로 보호.
+    """
+    def __init__(self, database_id, headers_fn):
+        self.database_id = database_id
+        self.headers_fn = headers_fn
+        self.properties = None # 속성 이름 -> 타입
+        self.options = {} # select/multi_select 속성 이름 -> {옵션 이름: 옵션 id}
+        self.title_property = TITLE_PROPERTY
+        self._warned = set()
+        self._lock = threading.RLock()
+
+    @property
+    def url(self):
+        return f"https://api.notion.com/v1/databases/{self.database_id}"
+
+    def update_from(self, data):
+        """데이터베이스 조회 응답(JSON)으로 캐시 갱신"""
+        self.properties = {}
+        self.options = {}
+        for name, prop in data.get("properties", {}).items():
+            kind = prop.get("type")
+            self.properties[name] = kind
+            if kind == "title":
+                self.title_property = name
+            if kind in ("select", "multi_select"):
+                self.options[name] = {o["name"]: o.get("id") for o in prop.get(kind, {}).get("options", [])}
+
+    def load(self, refresh=False):
+        """스키마를 가져와 캐시. 데이터베이스에 접근할 수 있으면 True."""
+        with self._lock:
+            if self.properties is not None and not refresh:
+                return True
+            try:
+                with httpx.Client() as client:
+                    response = client.get(self.url, headers=self.headers_fn())
+            except Exception as e:
+                print(f"Error loading Notion schema: {e}")
+                return False
+            if response.status_code != 200:
+                return False
+            self.update_from(response.json())
+            for problem in self.problems():
+                self._warn_once(("schema", problem), problem)
+            return True
+
+    def invalidate(self):
+        """스키마가 바뀐 것으로 보이면 다음 요청에서 다시 가져옴"""
+        with self._lock:
+            self.properties = None
+
+    def problems(self):
+        """코드가 기록하는 속성 중 데이터베이스에 없거나 타입이 다른 항목"""
+        if self.properties is None:
+            return []
+        found = []
+        for name, kind in REQUIRED_PROPERTIES.items():
+            if kind == "title":
+                continue
+            actual = self.properties.get(name)
+            if actual is None:
+                found.append(f"'{name}' ({kind}) 속성이 없어 기록하지 않습니다.")
+            elif actual != kind:
+                found.append(f"'{name}' 속성 타입이 {actual}입니다 (필요: {kind}). 기록하지 않습니다.")
+        return found
+
+    def _warn_once(self, key, message):
+        if key not in self._warned:
+            self._warned.add(key)
+            print(f"[Notion 스키마] {message}")
+
+    def _missing_options(self, wanted):
+        """캐시 기준으로 데이터베이스에 없는 옵션 {속성 이름: [옵션 이름]}"""
+        missing = {}
+        for prop, names in wanted.items():
+            if self.properties.get(prop) not in ("select", "multi_select"):
+                continue
+            existing = self.options.setdefault(prop, {})
+            for name in names:
+                name = option_name(name)
+                if name and name not in existing and name not in missing.get(prop, []):
+                    missing.setdefault(prop, []).append(name)
+        return missing
+
+    def ensure_options(self, wanted):
+        """
+        wanted: {속성 이름: 옵션 이름 목록}. 데이터베이스에 없는 옵션을 PATCH 한 번으로 생성.
+        기존 옵션도 함께 보내야 지워지지 않음. 성공(또는 추가할 옵션 없음) 시 True.
+        """
+        with self._lock:
+            if not self.load():
+                return False
+            if not self._missing_options(wanted):
+                return True
+            # 옵션 목록 전체를 덮어쓰므로 다른 실행/수동 편집으로 추가된 옵션이 지워지지 않도록 직전에 다시 조회
+            if not self.load(refresh=True):
+                return False
+            missing = self._missing_options(wanted)
+            if not missing:
+                return True
+            update = {}
+            for prop, names in missing.items():
+                kind = self.properties[prop]
+                options = [{"id": oid, "name": n} for n, oid in self.options[prop].items()] + [{"name": n} for n in names]
+                update[prop] = {kind: {"options": options}}
+            created = sum(len(names) for names in missing.values())
+            try:
+                with httpx.Client() as client:
+                    response = client.patch(self.url, headers=self.headers_fn(), json={"properties": update})
+            except Exception as e:
+                print(f"Error creating Notion select options: {e}")
+                return False
+            if response.status_code != 200:
+                print(f"Failed to create select options. Status: {response.status_code}, Body: {response.text}")
+                self.invalidate()
+                return False
+            self.update_from(response.json())
+            print(f"[Notion 스키마] 선택 옵션 {created}개 생성 ({', '.join(update)})")
+            return True
+
+    def prepare(self, properties):
+        """
+        보낼 properties를 스키마에 맞게 정리하여 반환. 필요한 옵션은 한 번에 생성.
+        스키마를 가져올 수 없으면 길이 제한만 적용하고 그대로 보냄.
+        """
+        prepared = {}
+        for name, value in properties.items():
+            if "title" in value:
+                _truncate_text(value["title"])
+            elif "rich_text" in value:
+                _truncate_text(value["rich_text"])
+            elif "select" in value and value["select"]:
+                select_name = option_name(value["select"].get("name"))
+                value = {"select": {"name": select_name} if select_name else None}
+            elif "multi_select" in value:
+                names = []
+                for o in value["multi_select"]:
+                    n = option_name(o.get("name"))
+                    if n and n not in names:
+                        names.append(n)
+                value = {"multi_select": [{"name": n} for n in names]}
+            elif "url" in value and value["url"] and len(value["url"]) > MAX_URL_LENGTH:
+                value = {"url": None}
+            prepared[name] = value
+
+        with self._lock:
+            if not self.load():
+                return prepared
+            checked = {}
+            wanted = {}
+            for name, value in prepared.items():
+                kind = next(iter(value))
+                if kind == "title":
+                    name = self.title_property
+                actual = self.properties.get(name)
+                if actual is None:
+                    self._warn_once(("missing", name), f"'{name}' 속성이 데이터베이스에 없어 제외합니다.")
+                    continue
+                if actual != kind:
+                    self._warn_once(("type", name), f"'{name}' 속성 타입({actual})이 보내는 값({kind})과 달라 제외합니다.")
+                    continue
+                checked[name] = value
+                if kind == "select" and value["select"]:
+                    wanted[name] = [value["select"]["name"]]
+                elif kind == "multi_select":
+                    wanted[name] = [o["name"] for o in value["multi_select"]]
+            self.ensure_options(wanted)
+            return checked
@@ -0,0 +1,141 @@
+import queue
+import threading
+import time
+from article_store import ArticleStore, STATUS_PENDING, STATUS_PUBLISHED
+from notion_integrator import add_article_to_notion, update_article_presses, database_schema
+
+def publish_article(store, row):
+    """저장소의 기사 한 건을 Notion에 게시하고 성공 여부를 반환. 사건 묶음의 언론사를 모두 함께 기록."""
+    presses = store.cluster_presses(row['cluster_id']) if row['cluster_id'] else []
+    page_id = add_article_to_notion(
+        title=row['title'], link=row['link'], date=row['pub_date'], description=row['description'],
+        category=row['category'] or "기타", type="뉴스", press=presses or row['press'] or "정보 없음",
+        full_content=row['content'], summary=row['summary'] or ""
+    )
+    if page_id:
+        store.mark_published(row['id'], page_id, presses)
+    return bool(page_id)
+
+def sync_cluster_presses(store, row):
+    """게시된 대표 기사 페이지의 '언론사'를 묶음 전체 언론사로 갱신"""
+    if update_article_presses(row['notion_page_id'], store.cluster_presses(row['id'])):
+        store.mark_presses_synced(row['id'])
+        return True
+    return False
+
+def ensure_publish_options(store, rows):
+    """게시/언론사 갱신할 기사들에 필요한 선택 옵션을 데이터베이스 PATCH 한 번으로 미리 생성"""
+    if not rows:
+        return
+    presses = set()
+    for row in rows:
+        presses.update(store.cluster_presses(row['cluster_id']) if row['cluster_id'] else [row['press'] or "정보 없음"])
+    database_schema.ensure_options({
+        "분야": sorted({row['category'] or "기타" for row in rows if row['status'] == STATUS_PENDING}),
+        "유형": ["뉴스"],
+        "언론사": sorted(presses),
+    })
+
+def publish_pending_articles(store, delay=0.5):
+    """게시 대기(pending) 기사를 Notion에 게시하고 언론사 목록이 바뀐 묶음을 갱신. 게시 성공 건수를 반환."""
+    rows = store.pending_articles()
+    count = 0
+    
+    # 기사마다 옵션 추가 요청을 보내지 않도록 미리 한 번에 생성
+    ensure_publish_options(store, rows + store.unsynced_clusters())
+    for i, row in enumerate(rows):
+        print(f"[{i+1}/{len(rows)}] Notion 게시: {row['title'][:30]}...")
+        if publish_article(store, row):
+            count += 1
+        time.sleep(delay)
+    for row in store.unsynced_clusters():
+        sync_cluster_presses(store, row)
+        time.sleep(delay)
+    return count
+
+class NotionPublisher:
+    """
+    크롤링과 별도로 Notion 게시를 처리하는 백그라운드 워커.
+    submit()으로 article id를 넘기면 자체 DB 연결로 게시하므로 크롤링 루프가 Notion 응답을 기다리지 않음.
+    submit_presses()는 같은 사건 기사가 추가된 대표 페이지의 언론사 목록 갱신을 예약.
+    대기 중인 작업을 한꺼번에 꺼내 필요한 선택 옵션을 먼저 한 번에 생성한 뒤 순서대로 처리.
+    """
+    _STOP = object()
+
+    def __init__(self, db_path=None, delay=0.5):
+        self.db_path = db_path
+        self.delay = delay
+        self.published = 0
+        self.failed = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="notion-publisher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def submit(self, article_id):
+        self._queue.put(("publish", article_id))
+
+    def submit_presses(self, cluster_id):
+        self._queue.put(("presses", cluster_id))
+
+    def close(self):
+        """남은 게시 작업을 모두 처리할 때까지 대기"""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _publish(self, store, row):
+        if row['status'] != STATUS_PENDING:
+            return
+        if publish_article(store, row):
+            self.published += 1
+        else:
+            self.failed += 1
+
+    def _sync_presses(self, store, row):
+        # 아직 게시 전이면 게시할 때 묶음 언론사가 함께 기록되므로 건너뜀
+        if row['status'] != STATUS_PUBLISHED or row['presses_synced']:
+            return
+        sync_cluster_presses(store, row)
+
+    def _next_batch(self):
+        """작업 하나를 기다린 뒤 이미 쌓여 있는 작업을 함께 꺼냄"""
+        batch = [self._queue.get()]
+        while batch[-1] is not self._STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        store = ArticleStore(self.db_path)
+        try:
+            while True:
+                batch = self._next_batch()
+                stop = batch[-1] is self._STOP
+                tasks = [task for task in batch if task is not self._STOP]
+                rows = [(kind, store.get_article(article_id)) for kind, article_id in tasks]
+                rows = [(kind, row) for kind, row in rows if row is not None]
+                try:
+                    ensure_publish_options(store, [row for _, row in rows])
+                except Exception as e:
+                    print(f"Notion 선택 옵션 생성 중 오류: {e}")
+                for kind, row in rows:
+                    # 앞 작업에서 상태가 바뀌었을 수 있으므로 다시 읽음
+                    row = store.get_article(row['id'])
+                    try:
+                        if kind == "publish":
+                            self._publish(store, row)
+                        else:
+                            self._sync_presses(store, row)
+                    except Exception as e:
+                        print(f"Notion 게시 중 오류 ({row['title'][:30]}): {e}")
+                        if kind == "publish":
+                            self.failed += 1
+                    time.sleep(self.delay)
+                if stop:
+                    break
+        finally:
+            store.close()
@@ -0,0 +1,116 @@
+import os
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from scraper import fetch_article_html, parse_article_html, empty_article_details
+from profiler import profiler
+
+# 네트워크 동시성 (기사 HTML 동시 다운로드 수)
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "4"))
+
+# HTML 파싱 프로세스 수. 0이면 프로세스 풀 없이 다운로드 스레드에서 바로 파싱.
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0"))
+
+def configure_workers(fetch_workers=None, parse_workers=None):
+    """CLI 옵션으로 기본 worker 수 변경 (None이면 유지)"""
+    global FETCH_WORKERS, PARSE_WORKERS
+    if fetch_workers is not None:
+        FETCH_WORKERS = fetch_workers
+    if parse_workers is not None:
+        PARSE_WORKERS = parse_workers
+
+def _parse_timed(url, raw, encoding):
+    """프로세스 풀 작업: 자식 프로세스의 프로파일러는 꺼져 있으므로 파싱 시간을 결과와 함께 돌려줌"""
+    started = time.perf_counter()
+    details = parse_article_html(url, raw, encoding)
+    return details, time.perf_counter() - started
+
+def _mp_context():
+    # 게시/LLM/다운로드 스레드가 이미 실행 중이므로 fork 대신 새 프로세스에서 시작 (상속된 lock으로 인한 교착 방지)
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+class ArticleParserPool:
+    """
+    기사 본문 추출 파이프라인: 다운로드는 스레드 풀(fetch_workers), BeautifulSoup 파싱과 정규식 추출은
+    프로세스 풀(parse_workers)에서 실행하여 GIL에 묶이지 않고 여러 코어를 사용.
+    두 풀의 크기는 서로 독립적이며, 프로세스 간에는 raw bytes와 추출 결과 dict만 오감.
+    """
+    def __init__(self, fetch_workers=None, parse_workers=None):
+        self.fetch_workers = FETCH_WORKERS if fetch_workers is None else fetch_workers
+        self.parse_workers = PARSE_WORKERS if parse_workers is None else parse_workers
+        self._fetch_pool = ThreadPoolExecutor(max_workers=max(1, self.fetch_workers), thread_name_prefix="fetch")
+        self._parse_pool = None
+        if self.parse_workers > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=_mp_context())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._fetch_pool.shutdown(wait=True)
+        if self._parse_pool:
+            self._parse_pool.shutdown(wait=True)
+
+    def _fetch(self, url):
+        with profiler.article(url):
+            raw, encoding = fetch_article_html(url)
+            if raw is not None and self._parse_pool is None:
+                return parse_article_html(url, raw, encoding), None
+            return None, (raw, encoding)
+
+    def _on_parsed(self, url, parse_future, result):
+        try:
+            details, elapsed = parse_future.result()
+        except Exception as e:
+            result.set_exception(e)
+            return
+        # 자식 프로세스 안의 세부 단계(html_parse, reporter_regex)는 수집되지 않고 'parse' 하나로 기록됨
+        profiler.record(url, "parse", elapsed)
+        result.set_result(details)
+
+    def submit(self, url):
+        """기사 한 건의 추출 결과(dict) Future 반환"""
+        result = Future()
+
+        def on_fetched(fetch_future):
+            try:
+                details, fetched = fetch_future.result()
+            except Exception as e:
+                result.set_exception(e)
+                return
+            if details is not None:
+                result.set_result(details)
+                return
+            raw, encoding = fetched
+            if raw is None:
+                result.set_result(empty_article_details())
+                return
+            parse_future = self._parse_pool.submit(_parse_timed, url, raw, encoding)
+            parse_future.add_done_callback(lambda f: self._on_parsed(url, f, result))
+
+        self._fetch_pool.submit(self._fetch, url).add_done_callback(on_fetched)
+        return result
+
+    def iter_details(self, urls, window=None):
+        """
+        urls 순서대로 (url, details)를 반환. 동시에 진행하는 기사 수를 window로 제한하여
+        큰 수집(--year)에서도 HTML 원본이 메모리에 한꺼번에 쌓이지 않음.
+        """
+        window = window or 4 * max(self.fetch_workers, self.parse_workers, 1)
+        pending = deque()
+        urls = iter(urls)
+        for url in urls:
+            pending.append((url, self.submit(url)))
+            if len(pending) >= window:
+                break
+        while pending:
+            url, future = pending.popleft()
+            next_url = next(urls, None)
+            if next_url is not None:
+                pending.append((next_url, self.submit(next_url)))
+            yield url, future.result()
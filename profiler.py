@@ -0,0 +1,193 @@
+import os
+import sys
+import time
+import threading
+import functools
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urlsplit
+
+_NULL = nullcontext()
+
+# 기사 컨텍스트 밖에서 측정된 단계(검색, 날짜 필터 등)를 모으는 키
+RUN_KEY = "(run)"
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def domain_of(url):
+    return (urlsplit(url).hostname or url) if url else RUN_KEY
+
+class Profiler:
+    """
+    --profile 모드용 프로파일러.
+    - stage()/article()/switch_article()로 기사별, 단계별 경과 시간을 결정적으로 측정
+    - 백그라운드 샘플러가 주기적으로 각 스레드의 호출 스택을 수집하여
+      'article:<도메인>;stage:<단계>;함수...' 형태의 collapsed stack (flamegraph.pl, speedscope 입력)으로 집계
+    비활성 상태에서는 모든 훅이 아무 일도 하지 않음.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.interval = 0.005
+        self._local = threading.local()
+        self._contexts = {} # thread ident -> thread-local 컨텍스트 (샘플러가 읽음)
+        self._lock = threading.Lock()
+        self._sampler = None
+        self.samples = Counter()
+        self.article_times = defaultdict(lambda: defaultdict(float)) # article -> stage -> 초
+
+    # --- 시작 / 종료 ---
+
+    def enable(self, interval=0.005):
+        self.enabled = True
+        self.interval = interval
+        self._sampler = threading.Thread(target=self._sample_loop, name="profiler-sampler", daemon=True)
+        self._sampler.start()
+
+    def disable(self):
+        self.enabled = False
+        if self._sampler:
+            self._sampler.join()
+            self._sampler = None
+
+    # --- 측정 훅 ---
+
+    def _context(self):
+        ctx = self._local.__dict__
+        if "stages" not in ctx:
+            ctx["stages"] = []
+            ctx["article"] = None
+            ctx["article_started"] = 0.0
+            self._contexts[threading.get_ident()] = ctx
+        return ctx
+
+    def _record(self, article, stage, elapsed):
+        with self._lock:
+            self.article_times[article or RUN_KEY][stage] += elapsed
+
+    def record(self, article, stage, elapsed):
+        """다른 프로세스 등에서 측정한 단계 시간을 기록"""
+        if self.enabled:
+            self._record(article, stage, elapsed)
+
+    @contextmanager
+    def _stage(self, name):
+        ctx = self._context()
+        ctx["stages"].append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ctx["stages"].pop()
+            self._record(ctx["article"], name, time.perf_counter() - started)
+
+    def stage(self, name):
+        """단계 시간 측정 (with profiler.stage("parse"): ...)"""
+        if not self.enabled:
+            return _NULL
+        return self._stage(name)
+
+    def profiled(self, name):
+        """함수 전체를 하나의 단계로 측정하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def switch_article(self, article):
+        """현재 스레드의 기사 컨텍스트를 바꿈 (이전 기사는 종료). 반복문 안에서 continue와 함께 쓰기 위함."""
+        if not self.enabled:
+            return
+        self.end_article()
+        ctx = self._context()
+        ctx["article"] = article
+        ctx["article_started"] = time.perf_counter()
+
+    def end_article(self):
+        if not self.enabled:
+            return
+        ctx = self._context()
+        if ctx["article"] is not None:
+            self._record(ctx["article"], "total", time.perf_counter() - ctx["article_started"])
+            ctx["article"] = None
+
+    @contextmanager
+    def _article(self, article):
+        ctx = self._context()
+        previous = ctx["article"]
+        ctx["article"] = article
+        try:
+            yield
+        finally:
+            ctx["article"] = previous
+
+    def article(self, article):
+        """
+        with 블록 동안 현재 스레드의 기사 컨텍스트 지정 (스레드 풀 작업용).
+        단계 시간만 기록하며, 기사별 'total'은 switch_article을 호출하는 메인 스레드만 기록 (중복 집계 방지).
+        """
+        if not self.enabled:
+            return _NULL
+        return self._article(article)
+
+    # --- 샘플링 ---
+
+    def _sample_loop(self):
+        while self.enabled:
+            time.sleep(self.interval)
+            frames = sys._current_frames()
+            for ident, ctx in list(self._contexts.items()):
+                stages = list(ctx["stages"])
+                article = ctx["article"]
+                frame = frames.get(ident)
+                if frame is None or (not stages and article is None):
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.reverse()
+                prefix = [f"article:{domain_of(article)}"] + [f"stage:{s}" for s in stages]
+                key = ";".join(prefix + stack).replace(" ", "_")
+                with self._lock:
+                    self.samples[key] += 1
+
+    # --- 결과 ---
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        print(f"프로파일 저장: {path} (샘플 {sum(self.samples.values())}개, flamegraph.pl/speedscope로 확인)")
+
+    def print_report(self, top_n=10):
+        articles = {k: v for k, v in self.article_times.items() if k != RUN_KEY and v.get("total")}
+
+        print("[단계별 누적 시간]")
+        stage_totals = Counter()
+        for stages in self.article_times.values():
+            for stage, elapsed in stages.items():
+                if stage != "total":
+                    stage_totals[stage] += elapsed
+        for stage, elapsed in stage_totals.most_common():
+            print(f"- {stage}: {elapsed:.2f}초")
+
+        print(f"[가장 느린 기사 Top {top_n}]")
+        slowest = sorted(articles.items(), key=lambda kv: kv[1]["total"], reverse=True)[:top_n]
+        for article, stages in slowest:
+            detail = ", ".join(f"{s} {t:.2f}s" for s, t in sorted(stages.items(), key=lambda kv: -kv[1]) if s != "total")
+            print(f"- {stages['total']:.2f}초 {article} ({detail})")
+
+        print(f"[가장 느린 도메인 Top {top_n}]")
+        domains = defaultdict(lambda: [0, 0.0])
+        for article, stages in articles.items():
+            entry = domains[domain_of(article)]
+            entry[0] += 1
+            entry[1] += stages["total"]
+        for domain, (count, total) in sorted(domains.items(), key=lambda kv: kv[1][1], reverse=True)[:top_n]:
+            print(f"- {domain}: {count}건, 합계 {total:.2f}초, 평균 {total / count:.2f}초")
+
+profiler = Profiler()
@@ -0,0 +1,153 @@
+import time
+from datetime import datetime
+from url_dedup import dedup_keys
+
+# 네이버 뉴스 검색 API 제한: start 최대 1000, display 최대 100
+NAVER_MAX_START = 1000
+NAVER_MAX_DISPLAY = 100
+
+# 쿼리가 1000건 한도에 걸렸을 때 덧붙여 검색 범위를 나누는 보조 키워드
+DEFAULT_EXPANSION_TERMS = ["치료", "환자", "인슐린", "지원", "연구", "학생", "보험"]
+
+def parse_pub_date(item):
+    return datetime.strptime(item['pubDate'], "%a, %d %b %Y %H:%M:%S %z")
+
+class QueryStats:
+    def __init__(self, query, sort):
+        self.query = query
+        self.sort = sort
+        self.calls = 0
+        self.fetched = 0
+        self.new = 0
+        self.saturated = False
+        self.dropped = False
+
+    @property
+    def overlap(self):
+        if not self.fetched:
+            return 0.0
+        return 1 - self.new / self.fetched
+
+class QueryPlanner:
+    """
+    네이버 검색 쿼리 실행 계획기.
+    - 쿼리별 호출 수 / 신규 기사 수(한계 수익)와 중복률을 추적
+    - 한 페이지의 신규 비율이 min_yield 미만인 상태가 redundant_pages번 이어지면 중복 쿼리로 보고 중단
+    - 1000건 한도까지 가득 찬 쿼리는 보조 키워드를 붙인 확장 쿼리를 자동으로 추가
+    중복 확인은 정규화 URL(link/originallink) 기준. 한 실행 안에서는 크기 제한 없는 집합으로 확인하고,
+    seen_cache(RecentKeyCache)를 넘기면 --loop처럼 여러 실행에 걸쳐 이미 본 기사도 건너뜀.
+    """
+    def __init__(self, search_fn, expansion_terms=None, min_yield=0.1, redundant_pages=2, delay=0.3, seen_cache=None):
+        self.search_fn = search_fn
+        self.expansion_terms = DEFAULT_EXPANSION_TERMS if expansion_terms is None else expansion_terms
+        self.min_yield = min_yield
+        self.redundant_pages = redundant_pages
+        self.delay = delay
+        self.seen_cache = seen_cache
+        self.run_keys = set() # 이번 실행에서 본 정규화 URL
+        self.articles = []
+        self.stats = []
+
+    def _is_seen(self, item):
+        keys = dedup_keys(item)
+        if not self.run_keys.isdisjoint(keys):
+            return True
+        return self.seen_cache is not None and self.seen_cache.seen(keys)
+
+    def _mark_seen(self, item):
+        keys = dedup_keys(item)
+        self.run_keys.update(keys)
+        if self.seen_cache is not None:
+            self.seen_cache.add(keys)
+
+    def _run_query(self, query, sort, start_date):
+        stats = QueryStats(query, sort)
+        self.stats.append(stats)
+        low_yield_pages = 0
+        reached_cap = False
+
+        for start_idx in range(1, NAVER_MAX_START + 1, NAVER_MAX_DISPLAY):
+            articles = self.search_fn(query, display=NAVER_MAX_DISPLAY, start=start_idx, sort=sort)
+            stats.calls += 1
+            if not articles: break
+
+            # date 정렬일 때는 start_date보다 오래된 기사가 나오면 이후 페이지는 볼 필요 없음
+            out_of_range = False
+            if sort == 'date' and start_date:
+                try:
+                    if parse_pub_date(articles[-1]) < start_date:
+                        out_of_range = True
+                        articles = [a for a in articles if parse_pub_date(a) >= start_date]
+                except (KeyError, ValueError):
+                    pass
+
+            page_new = 0
+            for a in articles:
+                stats.fetched += 1
+                if self._is_seen(a): continue
+                self._mark_seen(a)
+                self.articles.append(a)
+                page_new += 1
+            stats.new += page_new
+
+            if out_of_range: break
+
+            if len(articles) < NAVER_MAX_DISPLAY: break
+            if start_idx + NAVER_MAX_DISPLAY > NAVER_MAX_START:
+                reached_cap = True
+                break
+
+            # 다른 쿼리와 거의 같은 결과만 나오면 중복 쿼리로 판단하고 중단
+            if page_new < len(articles) * self.min_yield:
+                low_yield_pages += 1
+                if low_yield_pages >= self.redundant_pages:
+                    stats.dropped = True
+                    print(f" -> '{query}' ({sort}) 중복률 {stats.overlap:.0%}, 중복 쿼리로 판단하여 중단")
+                    break
+            else:
+                low_yield_pages = 0
+
+            time.sleep(self.delay)
+
+        stats.saturated = reached_cap
+        return stats
+
+    def collect(self, queries, sort_methods=("date",), start_date=None):
+        """
+        queries x sort_methods 조합을 실행하고 URL 기준으로 중복 제거된 기사 목록을 반환.
+        한도에 걸린 쿼리는 확장 쿼리를 큐에 추가하며, 확장 쿼리는 다시 확장하지 않음.
+        """
+        pending = [(q, s, True) for q in queries for s in sort_methods]
+        planned = set((q, s) for q, s, _ in pending)
+
+        while pending:
+            query, sort, expandable = pending.pop(0)
+            print(f"'{query}' 검색 중 (정렬: {sort})...")
+            stats = self._run_query(query, sort, start_date)
+
+            if stats.saturated and expandable:
+                print(f" -> '{query}' ({sort}) 검색 한도(1000건) 도달, 확장 쿼리 추가")
+                for term in self.expansion_terms:
+                    key = (f"{query} {term}", sort)
+                    if key in planned: continue
+                    planned.add(key)
+                    pending.append((key[0], sort, False))
+
+        self.print_report()
+        return self.articles
+
+    @property
+    def total_calls(self):
+        return sum(s.calls for s in self.stats)
+
+    def print_report(self):
+        print("[검색 쿼리 리포트]")
+        for s in self.stats:
+            flags = []
+            if s.saturated: flags.append("한도 도달")
+            if s.dropped: flags.append("중복 중단")
+            flag_text = f" ({', '.join(flags)})" if flags else ""
+            print(f"- '{s.query}' ({s.sort}): 호출 {s.calls}회, 수집 {s.fetched}건, 신규 {s.new}건, 중복률 {s.overlap:.0%}{flag_text}")
+        calls = self.total_calls
+        per_call = len(self.articles) / calls if calls else 0.0
+        print(f"총 API 호출 {calls}회, 고유 기사 {len(self.articles)}건 (호출당 {per_call:.1f}건)")
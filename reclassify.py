@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from article_store import ArticleStore, STATUS_PENDING, STATUS_PUBLISHED, STATUS_IRRELEVANT
+from notion_integrator import update_article_classification, archive_notion_page
+from notion_sync import publish_pending_articles
+from classifier import llm_classifier
+
+def _apply_result(store, row, result):
+    """
+    재분류 결과 한 건을 저장소와 Notion에 반영. "changed" / "unchanged" / "failed" 중 하나를 반환.
+    Notion 반영에 실패하면 classifier_version을 갱신하지 않아 다음 실행에서 재시도.
+    """
+    category = result.get("category", "기타")
+    summary = result.get("summary", "")
+    version = result["classifier_version"]
+
+    if category == row['category'] and summary == (row['summary'] or ""):
+        store.update_classification(row['id'], category, summary, version)
+        return "unchanged"
+
+    page_id = row['notion_page_id']
+    if category == "관련없음":
+        if page_id and not archive_notion_page(page_id):
+            return "failed"
+        store.update_classification(row['id'], category, summary, version, status=STATUS_IRRELEVANT, clear_notion_page=True)
+    elif row['status'] == STATUS_PUBLISHED and page_id:
+        if not update_article_classification(page_id, category, summary):
+            return "failed"
+        store.update_classification(row['id'], category, summary, version)
+    else:
+        # 관련없음 -> 관련 기사로 바뀐 경우 등: 게시 대기로 돌려 새로 게시
+        store.update_classification(row['id'], category, summary, version, status=STATUS_PENDING)
+    return "changed"
+
+def run_reclassify(batch_size=20, workers=4, limit=None, include_local=False):
+    """
+    현재 LLM 모델/프롬프트 버전과 다르게 분류된 기사만 저장된 본문으로 재분류.
+    로컬 분류기로 분류된 기사는 include_local일 때만 다시 LLM으로 분류.
+    HTML을 다시 가져오지 않으며, 배치마다 최대 workers개의 LLM 요청을 동시에 실행.
+    """
+    if not llm_classifier.client:
+        print("GEMINI_API_KEY가 없어 재분류를 실행할 수 없습니다.")
+        return
+
+    version = llm_classifier.version
+    with ArticleStore() as store:
+        rows = store.articles_needing_reclassification(version, limit=limit, include_local=include_local)
+        print(f"재분류 대상: {len(rows)}건 (현재 버전: {version})")
+
+        count_changed = 0
+        count_failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_start in range(0, len(rows), batch_size):
+                batch = rows[batch_start:batch_start + batch_size]
+                results = executor.map(lambda r: llm_classifier.classify_article(r['title'], r['content'] or ""), batch)
+                for row, result in zip(batch, results):
+                    if not result:
+                        count_failed += 1
+                        continue
+                    outcome = _apply_result(store, row, result)
+                    if outcome == "failed":
+                        count_failed += 1
+                    elif outcome == "changed":
+                        count_changed += 1
+                        print(f" -> 변경: {row['title'][:30]}... ({row['category']} -> {result.get('category')})")
+                print(f"[{min(batch_start + batch_size, len(rows))}/{len(rows)}] 재분류 진행 중...")
+
+        # 새로 관련 기사가 된 항목 게시
+        count_published = publish_pending_articles(store)
+        print(f"재분류 완료! 변경: {count_changed}건, 실패: {count_failed}건, 신규 게시: {count_published}건")
+        llm_classifier.print_usage_report()
@@ -1,17 +1,24 @@
 import os
 import requests
 import json
+import hashlib
 from datetime import datetime
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 import re
 import html
+from profiler import profiler
 
 load_dotenv()
 
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
+# 관련성 판단 키워드 (content_condenser에서 문장 점수 계산에도 사용)
+GENERAL_KEYWORDS = ['1형 당뇨', '1형당뇨']
+STRONG_KEYWORDS = ['소아당뇨', '췌장장애']
+
+@profiler.profiled("search")
 def search_naver_news(query, display=100, start=1, sort='date'):
     url = "https://openapi.naver.com/v1/search/news.json"
     headers = {
@@ -21,7 +28,8 @@ def search_naver_news(query, display=100, start=1, sort='date'):
     params = {"query": query, "display": display, "start": start, "sort": sort}
     response = requests.get(url, headers=headers, params=params)
     if response.status_code == 200:
-        items = response.json().get('items', [])
+        with profiler.stage("json"):
+            items = response.json().get('items', [])
         # 초기 단계에서 인코딩 수정
         for item in items:
             item['title'] = html.unescape(item['title']).replace('<b>', '').replace('</b>', '')
@@ -29,15 +37,52 @@ def search_naver_news(query, display=100, start=1, sort='date'):
         return items
     return []
 
-def extract_article_details(url):
-    details = {"content": "", "reporter": "정보 없음", "company": "정보 없음", "mentions": ""}
+# 본문 추출 결과 기본값 (fetch 실패 시에도 같은 형태 반환)
+def empty_article_details():
+    return {"content": "", "reporter": "정보 없음", "company": "정보 없음", "mentions": ""}
+
+# 설정하면 가져온 기사 HTML을 저장 (bench_parse.py 벤치마크 코퍼스)
+HTML_CORPUS_DIR = os.getenv("HTML_CORPUS_DIR")
+
+def _save_html(url, raw, encoding):
+    name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html"
+    os.makedirs(HTML_CORPUS_DIR, exist_ok=True)
+    with open(os.path.join(HTML_CORPUS_DIR, name), "wb") as f:
+        f.write(raw)
+    with open(os.path.join(HTML_CORPUS_DIR, "index.tsv"), "a", encoding="utf-8") as f:
+        f.write(f"{name}\t{url}\t{encoding or ''}\n")
+
+@profiler.profiled("fetch")
+def fetch_article_html(url):
+    """기사 HTML 원본을 가져옴. (raw bytes, encoding) 또는 실패 시 (None, None)"""
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
         response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200: return details
+        if response.status_code != 200: return None, None
+        encoding = response.encoding or response.apparent_encoding
+        if HTML_CORPUS_DIR:
+            _save_html(url, response.content, encoding)
+        return response.content, encoding
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return None, None
+
+def parse_article_html(url, raw, encoding=None):
+    """
+    기사 HTML에서 언론사, 기자명, 본문을 추출. 네트워크를 쓰지 않는 순수 CPU 작업이며
+    인자/반환값이 모두 pickle 가능하므로 프로세스 풀(parse_pool)에서 실행할 수 있음.
+    """
+    details = empty_article_details()
+    try:
+        # requests의 response.text와 같은 방식으로 디코딩
+        try:
+            text = raw.decode(encoding or "utf-8", errors="replace")
+        except LookupError:
+            text = raw.decode("utf-8", errors="replace")
         
         # HTML 엔티티 변환을 위해 BeautifulSoup 사용 전 unescape 고려 가능하나 soup이 처리해줌
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with profiler.stage("html_parse"):
+            soup = BeautifulSoup(text, 'html.parser')
         
         # 1. 네이버 뉴스 전용 고정밀 추출
         if "news.naver.com" in url:
@@ -109,13 +154,14 @@ def extract_article_details(url):
                 ]
                 # 기사 앞쪽 500자 이내에서 검색
                 search_text = text_content[:500]
-                for p in patterns:
-                    match = re.search(p, search_text)
-                    if match:
-                        name = match.group(1).strip()
-                        if 2 <= len(name) <= 4: # 한국인 이름 길이 체크
-                            details["reporter"] = f"{name} 기자"
-                            break
+                with profiler.stage("reporter_regex"):
+                    for p in patterns:
+                        match = re.search(p, search_text)
+                        if match:
+                            name = match.group(1).strip()
+                            if 2 <= len(name) <= 4: # 한국인 이름 길이 체크
+                                details["reporter"] = f"{name} 기자"
+                                break
 
         # 4. 언급 요약 (사용 안 함)
         details["mentions"] = ""
@@ -128,6 +174,7 @@ def extract_article_details(url):
 def summarize_mentions(text):
     return ""
 
+@profiler.profiled("relevance")
 def is_relevant_article(item, start_date=None, end_date=None, content=None):
     title = item.get('title', '').replace('<b>', '').replace('</b>', '')
     description = item.get('description', '').replace('<b>', '').replace('</b>', '')
@@ -158,8 +205,8 @@ def is_relevant_article(item, start_date=None, end_date=None, content=None):
             return False
 
     # 1. 문체부/문체위 관련 키워드 확인
-    general_keywords = ['1형 당뇨', '1형당뇨']
-    strong_keywords = ['소아당뇨', '췌장장애']
+    general_keywords = GENERAL_KEYWORDS
+    strong_keywords = STRONG_KEYWORDS
     all_keywords = general_keywords + strong_keywords
     
     # 제목에 키워드가 있으면 무조건 통과
@@ -0,0 +1,98 @@
+import os
+from datetime import datetime, timedelta
+from text_index import index_text
+
+# 제목/설명 bigram 유사도가 이 값 이상이면 같은 사건 보도로 판단
+STORY_SIMILARITY_THRESHOLD = float(os.getenv("STORY_SIMILARITY_THRESHOLD", "0.45"))
+
+# 발행 시각 기준 앞뒤 며칠까지의 기사와 비교할지
+STORY_WINDOW_DAYS = 1
+
+def _signature(title, description):
+    return set(index_text(title).split()), set(index_text(description).split())
+
+def _jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+def story_similarity(sig_a, sig_b):
+    """제목 유사도 위주로, 설명(리드) 유사도를 보조로 반영"""
+    return 0.7 * _jaccard(sig_a[0], sig_b[0]) + 0.3 * _jaccard(sig_a[1], sig_b[1])
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, "%a, %d %b %Y %H:%M:%S %z")
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(value)
+
+class StoryClusterer:
+    """
+    같은 사건을 다룬 여러 언론사 기사를 묶음.
+    로컬 저장소의 대표 기사(발행일 앞뒤 STORY_WINDOW_DAYS일)와 이번 실행에서 새로 등록될 대표 기사를 비교.
+    """
+    def __init__(self, store, threshold=None, window_days=STORY_WINDOW_DAYS):
+        self.store = store
+        self.threshold = STORY_SIMILARITY_THRESHOLD if threshold is None else threshold
+        self.window = timedelta(days=window_days)
+        self.run_stories = [] # (key, signature, pub_dt)
+        self._stored_cache = {} # 날짜별 저장소 대표 기사 signature
+
+    def _stored_candidates(self, pub_dt):
+        day = pub_dt.date().isoformat()
+        if day not in self._stored_cache:
+            since = (pub_dt - self.window).replace(hour=0, minute=0, second=0).isoformat()
+            until = (pub_dt + self.window).replace(hour=23, minute=59, second=59).isoformat()
+            self._stored_cache[day] = [
+                (row['id'], _signature(row['title'], row['description'] or ""))
+                for row in self.store.cluster_candidates(since, until)
+            ]
+        return self._stored_cache[day]
+
+    def find_story(self, item):
+        """
+        같은 사건의 대표 기사를 찾으면 ("stored", article_id) 또는 ("run", key), 없으면 None.
+        가장 유사도가 높은 대표 기사를 선택.
+        """
+        pub_dt = _parse_date(item.get('pubDate'))
+        sig = _signature(item['title'], item.get('description', ''))
+        best, best_score = None, self.threshold
+
+        for article_id, other in self._stored_candidates(pub_dt):
+            score = story_similarity(sig, other)
+            if score >= best_score:
+                best, best_score = ("stored", article_id), score
+
+        for key, other, other_dt in self.run_stories:
+            if abs(other_dt - pub_dt) > self.window:
+                continue
+            score = story_similarity(sig, other)
+            if score >= best_score:
+                best, best_score = ("run", key), score
+        return best
+
+    def add_run_story(self, key, item):
+        """이번 실행에서 대표 기사가 될 기사를 비교 대상에 추가"""
+        pub_dt = _parse_date(item.get('pubDate'))
+        self.run_stories.append((key, _signature(item['title'], item.get('description', '')), pub_dt))
+
+def build_daily_digest(store, day):
+    """해당 날짜의 사건 묶음을 분야별로 정리한 마크다운 다이제스트"""
+    stories = store.daily_stories(day)
+    lines = [f"# 1형 당뇨 뉴스 다이제스트 ({day})", "", f"사건 {len(stories)}건", ""]
+
+    by_category = {}
+    for story in stories:
+        by_category.setdefault(story['category'] or "기타", []).append(story)
+
+    for category, items in by_category.items():
+        lines.append(f"## {category}")
+        for story in items:
+            presses = (story['presses'] or "").replace(",", ", ")
+            lines.append(f"- **{story['title']}** ({story['coverage']}개 보도: {presses})")
+            text = story['summary'] or story['description']
+            if text:
+                lines.append(f"  - {text}")
+            lines.append(f"  - {story['link']}")
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,51 @@
+import re
+
+# 한글은 띄어쓰기/조사 때문에 단어 단위 색인으로는 부분 검색이 안 되므로 글자 bigram으로 색인
+# 예) "1형당뇨" -> "1형 형당 당뇨"
+_WORD_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]")
+
+def _word_tokens(word):
+    word = word.lower()
+    if not _HANGUL_RE.search(word) or len(word) == 1:
+        return [word]
+    return [word[i:i+2] for i in range(len(word) - 1)]
+
+def index_text(text):
+    """FTS5 색인에 넣을 공백 구분 토큰 문자열 (SQLite 함수 ko_ngrams로 등록됨)"""
+    if not text:
+        return ""
+    tokens = []
+    for word in _WORD_RE.findall(text):
+        tokens.extend(_word_tokens(word))
+    return " ".join(tokens)
+
+def build_match_query(query):
+    """
+    검색어를 FTS5 MATCH 식으로 변환. 단어마다 bigram 구(phrase)를 만들고 AND로 결합.
+    한 글자 한글 단어는 bigram 접두어 검색으로 처리. 검색할 토큰이 없으면 None.
+    """
+    clauses = []
+    for word in _WORD_RE.findall(query or ""):
+        tokens = _word_tokens(word)
+        if len(tokens) == 1 and _HANGUL_RE.search(tokens[0]) and len(tokens[0]) == 1:
+            clauses.append(f'"{tokens[0]}"*')
+        else:
+            clauses.append('"' + " ".join(tokens) + '"')
+    return " AND ".join(clauses) if clauses else None
+
+def make_snippet(text, query, width=60):
+    """원문에서 첫 검색어 주변을 잘라 보여주기 위한 스니펫"""
+    if not text:
+        return ""
+    text = " ".join(text.split())
+    pos = -1
+    for word in _WORD_RE.findall(query or ""):
+        pos = text.lower().find(word.lower())
+        if pos >= 0:
+            break
+    if pos < 0:
+        return text[:width] + ("..." if len(text) > width else "")
+    start = max(0, pos - width // 2)
+    end = min(len(text), start + width)
+    return ("..." if start > 0 else "") + text[start:end] + ("..." if end < len(text) else "")
@@ -0,0 +1,84 @@
+import re
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+# 같은 기사를 가리키는 URL 변형에서 제거할 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "igshid", "mc_cid", "mc_eid", "ref", "referer", "from",
+    "cmpid", "rss", "sns", "share", "ved", "usg", "ocid", "src", "nclick", "lfrom",
+}
+
+_NAVER_HOST_RE = re.compile(r"(^|\.)naver\.com$")
+_NAVER_PATH_RE = re.compile(r"/article/(\d{3,})/(\d{6,})")
+
+def canonical_url(url):
+    """
+    같은 기사의 URL 변형을 하나의 키로 정규화.
+    - 네이버 뉴스: 도메인/경로 형식과 관계없이 언론사 ID(oid)와 기사 ID(aid)로 'naver:{oid}/{aid}'
+    - 그 외: scheme/www/m. 접두어/fragment/추적 파라미터/끝 '/' 제거, 나머지 파라미터는 정렬
+    """
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = (parts.hostname or "").lower()
+    for prefix in ("www.", "m.", "mobile."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    params = parse_qsl(parts.query, keep_blank_values=False)
+
+    if _NAVER_HOST_RE.search(host):
+        match = _NAVER_PATH_RE.search(parts.path)
+        if match:
+            return f"naver:{match.group(1)}/{match.group(2)}"
+        query = dict(params)
+        if query.get("oid") and query.get("aid"):
+            return f"naver:{query['oid']}/{query['aid']}"
+
+    kept = sorted((k, v) for k, v in params if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS)
+    path = parts.path.rstrip("/")
+    return f"{host}{path}" + (f"?{urlencode(kept)}" if kept else "")
+
+def dedup_keys(item):
+    """검색 결과의 link(네이버)와 originallink(언론사 원문) 정규화 키"""
+    keys = {canonical_url(item.get('link')), canonical_url(item.get('originallink'))}
+    keys.discard("")
+    return keys
+
+class RecentKeyCache:
+    """
+    크기와 보관 기간이 제한된 중복 확인용 키 캐시 (LRU + TTL).
+    --loop처럼 오래 실행되는 프로세스에서도 메모리 사용량이 일정하게 유지됨.
+    """
+    def __init__(self, max_size=50000, ttl_seconds=3 * 24 * 3600):
+        self.max_size = max_size
+        self.ttl = ttl_seconds
+        self._entries = OrderedDict() # key -> 마지막으로 본 시각 (오래된 순)
+
+    def _evict(self, now):
+        while self._entries:
+            key, seen_at = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_size and now - seen_at <= self.ttl:
+                break
+            self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        seen_at = self._entries.get(key)
+        return seen_at is not None and time.monotonic() - seen_at <= self.ttl
+
+    def seen(self, keys):
+        return any(key in self for key in keys)
+
+    def add(self, keys):
+        now = time.monotonic()
+        for key in keys:
+            self._entries[key] = now
+            self._entries.move_to_end(key)
+        self._evict(now)